@@ -22,7 +22,7 @@ class AlertingAgent(BaseAgent):
 
     def __init__(self, agent_id: str = None, max_concurrent_tasks: int = 20):
         super().__init__(agent_id, "alerting", max_concurrent_tasks)
-        self.alert_cache = {}  # For deduplication
+        self.alert_cache = {}  # For deduplication, ordered by last-sent time
         self.alert_cooldown = 60  # seconds
 
     async def process(self, inputs: List[AgentInput], parameters: Dict[str, Any]) -> AgentOutput:
@@ -104,21 +104,25 @@ class AlertingAgent(BaseAgent):
     def _deduplicate_alerts(self, alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate alerts within cooldown period"""
         current_time = time.time()
+        alert_cache = self.alert_cache
+        cooldown = self.alert_cooldown
         unique_alerts = []
 
         for alert in alerts:
             alert_id = alert["alert_id"]
 
             # Check if alert was recently sent
-            if alert_id in self.alert_cache:
-                last_sent = self.alert_cache[alert_id]
-                if current_time - last_sent < self.alert_cooldown:
-                    logger.debug(f"Suppressing duplicate alert {alert_id}")
+            last_sent = alert_cache.get(alert_id)
+            if last_sent is not None:
+                if current_time - last_sent < cooldown:
+                    logger.debug("Suppressing duplicate alert %s", alert_id)
                     continue
+                # Re-insert so the cache stays ordered by last-sent time
+                del alert_cache[alert_id]
 
             # Add to unique alerts and cache
             unique_alerts.append(alert)
-            self.alert_cache[alert_id] = current_time
+            alert_cache[alert_id] = current_time
 
         # Cleanup old cache entries
         self._cleanup_cache(current_time)
@@ -127,13 +131,14 @@ class AlertingAgent(BaseAgent):
 
     def _cleanup_cache(self, current_time: float):
         """Remove old entries from alert cache"""
-        expired_ids = [
-            alert_id for alert_id, timestamp in self.alert_cache.items()
-            if current_time - timestamp > self.alert_cooldown * 2
-        ]
-
-        for alert_id in expired_ids:
-            del self.alert_cache[alert_id]
+        # Entries are in last-sent order, so stop at the first fresh one
+        cutoff = current_time - self.alert_cooldown * 2
+        alert_cache = self.alert_cache
+        while alert_cache:
+            alert_id = next(iter(alert_cache))
+            if alert_cache[alert_id] >= cutoff:
+                break
+            del alert_cache[alert_id]
 
     def _prioritize_alerts(self, alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize alerts by severity"""
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 @dataclass
 class AgentInput:
     """Input data for agent processing"""
+    __slots__ = ('input_id', 'input_type', 'data', 'metadata')
+
     input_id: str
     input_type: str  # text, image, video, json, etc.
     data: Any
@@ -26,6 +28,8 @@ class AgentInput:
 @dataclass
 class AgentOutput:
     """Output from agent processing"""
+    __slots__ = ('output_type', 'data', 'metadata', 'processing_time_ms')
+
     output_type: str
     data: Any
     metadata: Dict[str, Any]
@@ -19,6 +19,9 @@ class DataAnalysisAgent(BaseAgent):
     Performs statistical analysis, trend detection, and anomaly detection
     """
 
+    # Simulated cost of computing summary statistics
+    STATISTICS_DELAY_SECONDS = 0.05
+
     def __init__(self, agent_id: str = None, max_concurrent_tasks: int = 15):
         super().__init__(agent_id, "data_analysis", max_concurrent_tasks)
 
@@ -67,29 +70,29 @@ class DataAnalysisAgent(BaseAgent):
     async def _compute_statistics(self, data_records: List[Dict]) -> Dict[str, Any]:
         """Compute summary statistics"""
         # Simulate statistical analysis
-        await asyncio.sleep(0.05)  # Simulate computation
+        await asyncio.sleep(self.STATISTICS_DELAY_SECONDS)  # Simulate computation
 
         # Extract numeric values if present
-        numeric_values = []
-        for record in data_records:
-            if isinstance(record, dict):
-                for key, value in record.items():
-                    if isinstance(value, (int, float)):
-                        numeric_values.append(value)
+        arr = np.fromiter(
+            (value for record in data_records if isinstance(record, dict)
+             for value in record.values() if isinstance(value, (int, float))),
+            dtype=np.float64
+        )
 
-        if numeric_values:
-            arr = np.array(numeric_values)
+        if arr.size:
+            # One partition for all three quartiles; the median is q50
+            q25, q50, q75 = np.percentile(arr, [25, 50, 75])
             stats = {
-                "count": len(numeric_values),
-                "mean": float(np.mean(arr)),
-                "median": float(np.median(arr)),
-                "std": float(np.std(arr)),
-                "min": float(np.min(arr)),
-                "max": float(np.max(arr)),
+                "count": int(arr.size),
+                "mean": float(arr.mean()),
+                "median": float(q50),
+                "std": float(arr.std()),
+                "min": float(arr.min()),
+                "max": float(arr.max()),
                 "quartiles": {
-                    "q25": float(np.percentile(arr, 25)),
-                    "q50": float(np.percentile(arr, 50)),
-                    "q75": float(np.percentile(arr, 75))
+                    "q25": float(q25),
+                    "q50": float(q50),
+                    "q75": float(q75)
                 }
             }
         else:
@@ -140,19 +143,19 @@ class DataAnalysisAgent(BaseAgent):
                         numeric_values.append({"key": key, "value": value})
 
         if numeric_values:
-            values = [v["value"] for v in numeric_values]
-            arr = np.array(values)
-            mean = np.mean(arr)
-            std = np.std(arr)
-
-            # Detect outliers (values > 3 std from mean)
-            for nv in numeric_values:
-                z_score = abs((nv["value"] - mean) / std) if std > 0 else 0
-                if z_score > 3:
+            arr = np.fromiter((nv["value"] for nv in numeric_values),
+                              dtype=np.float64, count=len(numeric_values))
+            std = arr.std()
+
+            # Detect outliers (values > 3 std from mean) in one vectorized pass
+            if std > 0:
+                z_scores = np.abs(arr - arr.mean()) / std
+                for i in np.flatnonzero(z_scores > 3)[:10]:
+                    nv = numeric_values[i]
                     anomalies.append({
                         "field": nv["key"],
                         "value": nv["value"],
-                        "z_score": float(z_score),
+                        "z_score": float(z_scores[i]),
                         "type": "outlier"
                     })
 
@@ -6,7 +6,7 @@ Supports text, images, JSON, and other formats
 import asyncio
 import json
 import base64
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TypedDict
 from PIL import Image
 import io
 import logging
@@ -16,6 +16,13 @@ from agents.base_agent import BaseAgent, AgentInput, AgentOutput
 logger = logging.getLogger(__name__)
 
 
+class IngestedData(TypedDict):
+    """Payload of an ingested_data output (kept a plain dict for downstream agents)"""
+    records: List[Dict[str, Any]]
+    count: int
+    types: List[str]
+
+
 class DataIngestAgent(BaseAgent):
     """
     Ingests and preprocesses multi-modal data
@@ -50,13 +57,15 @@ class DataIngestAgent(BaseAgent):
 
         processing_time = (asyncio.get_event_loop().time() - start_time) * 1000
 
+        data: IngestedData = {
+            "records": ingested_data,
+            "count": len(ingested_data),
+            "types": list({inp.input_type for inp in inputs})
+        }
+
         return AgentOutput(
             output_type="ingested_data",
-            data={
-                "records": ingested_data,
-                "count": len(ingested_data),
-                "types": list(set(inp.input_type for inp in inputs))
-            },
+            data=data,
             metadata={
                 "agent_id": self.agent_id,
                 "processing_time_ms": processing_time
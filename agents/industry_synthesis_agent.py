@@ -62,6 +62,11 @@ class IndustrySynthesisAgent(BaseAgent):
 
         logger.info(f"IndustrySynthesisAgent {agent_id} initialized")
 
+    async def shutdown(self):
+        """Graceful shutdown, flushing pending storage writes"""
+        await super().shutdown()
+        await self.storage.aclose()
+
     async def process(
         self,
         inputs: List[AgentInput],
@@ -137,7 +142,7 @@ class IndustrySynthesisAgent(BaseAgent):
             # Save to storage if requested
             file_path = None
             if save_to_storage:
-                file_path = self._save_report(
+                file_path = await self._save_report(
                     formatted_report,
                     report,
                     analysis,
@@ -689,7 +694,7 @@ Please provide your synthesis following the structure outlined in the system pro
 
         return builder.build()
 
-    def _save_report(
+    async def _save_report(
         self,
         formatted_report: str,
         report_data: Dict[str, Any],
@@ -710,7 +715,7 @@ Please provide your synthesis following the structure outlined in the system pro
             "date_range": analysis.get("date_range")
         }
 
-        file_path = self.storage.save_markdown(
+        file_path = await self.storage.save_markdown_async(
             content=formatted_report,
             filename=filename,
             content_type="synthesis_report",
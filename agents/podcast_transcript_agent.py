@@ -49,6 +49,11 @@ class PodcastTranscriptAgent(BaseAgent):
 
         logger.info(f"PodcastTranscriptAgent {agent_id} initialized")
 
+    async def shutdown(self):
+        """Graceful shutdown, flushing pending storage writes"""
+        await super().shutdown()
+        await self.storage.aclose()
+
     async def process(
         self,
         inputs: List[AgentInput],
@@ -106,7 +111,7 @@ class PodcastTranscriptAgent(BaseAgent):
                 # Save to storage if requested
                 file_path = None
                 if save_to_storage:
-                    file_path = self._save_transcript(
+                    file_path = await self._save_transcript(
                         formatted_transcript,
                         episode_data,
                         output_format
@@ -408,7 +413,7 @@ class PodcastTranscriptAgent(BaseAgent):
 
         return builder.build()
 
-    def _save_transcript(
+    async def _save_transcript(
         self,
         transcript: str,
         episode_data: Dict[str, Any],
@@ -435,7 +440,7 @@ class PodcastTranscriptAgent(BaseAgent):
             "word_count": len(transcript.split())
         }
 
-        file_path = self.storage.save_markdown(
+        file_path = await self.storage.save_markdown_async(
             content=transcript,
             filename=filename,
             content_type="transcript",
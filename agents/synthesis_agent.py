@@ -4,6 +4,7 @@ Generates structured outputs like JSON reports, summaries, etc.
 """
 
 import asyncio
+import functools
 import json
 from typing import List, Dict, Any
 from datetime import datetime
@@ -14,6 +15,31 @@ from agents.base_agent import BaseAgent, AgentInput, AgentOutput
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _executive_summary(count: Any, insight_count: int, anomaly_count: int) -> str:
+    """Executive summary text; it depends only on these three counts"""
+    summary_parts = []
+
+    if count:
+        summary_parts.append(
+            f"Analysis completed on {count} data points. "
+        )
+
+    if insight_count:
+        summary_parts.append(
+            f"Key insights identified: {insight_count} significant patterns detected. "
+        )
+
+    if anomaly_count:
+        summary_parts.append(
+            f"Attention required: {anomaly_count} anomalies detected requiring investigation."
+        )
+    else:
+        summary_parts.append("No critical anomalies detected.")
+
+    return "".join(summary_parts)
+
+
 class SynthesisAgent(BaseAgent):
     """
     Synthesizes analysis results into final deliverables
@@ -80,29 +106,11 @@ class SynthesisAgent(BaseAgent):
     def _create_executive_summary(self, analysis_data: Dict[str, Any]) -> str:
         """Create executive summary"""
         stats = analysis_data.get("summary_statistics", {})
-        insights = analysis_data.get("insights", [])
-        anomalies = analysis_data.get("anomalies", [])
-
-        summary_parts = []
-
-        if stats.get("count"):
-            summary_parts.append(
-                f"Analysis completed on {stats['count']} data points. "
-            )
-
-        if insights:
-            summary_parts.append(
-                f"Key insights identified: {len(insights)} significant patterns detected. "
-            )
-
-        if anomalies:
-            summary_parts.append(
-                f"Attention required: {len(anomalies)} anomalies detected requiring investigation."
-            )
-        else:
-            summary_parts.append("No critical anomalies detected.")
-
-        return "".join(summary_parts)
+        return _executive_summary(
+            stats.get("count"),
+            len(analysis_data.get("insights", [])),
+            len(analysis_data.get("anomalies", []))
+        )
 
     def _generate_recommendations(self, analysis_data: Dict[str, Any]) -> List[Dict[str, str]]:
         """Generate actionable recommendations"""
@@ -59,6 +59,11 @@ class TranscriptSummaryAgent(BaseAgent):
 
         logger.info(f"TranscriptSummaryAgent {agent_id} initialized with LLM provider")
 
+    async def shutdown(self):
+        """Graceful shutdown, flushing pending storage writes"""
+        await super().shutdown()
+        await self.storage.aclose()
+
     async def process(
         self,
         inputs: List[AgentInput],
@@ -117,7 +122,7 @@ class TranscriptSummaryAgent(BaseAgent):
                 # Save to storage if requested
                 file_path = None
                 if save_to_storage:
-                    file_path = self._save_summary(
+                    file_path = await self._save_summary(
                         formatted_summary,
                         summary_data,
                         metadata
@@ -167,7 +172,7 @@ class TranscriptSummaryAgent(BaseAgent):
             # Load from file
             content, metadata = self.storage.load_markdown(agent_input.data)
             # Merge with input metadata
-            full_metadata = {**metadata, **agent_input.metadata}
+            full_metadata = {**(metadata or {}), **agent_input.metadata}
             return content, full_metadata
 
         else:
@@ -486,7 +491,7 @@ Please provide your analysis following the structure outlined in the system prom
 
         return builder.build()
 
-    def _save_summary(
+    async def _save_summary(
         self,
         formatted_summary: str,
         summary_data: Dict[str, Any],
@@ -514,7 +519,7 @@ Please provide your analysis following the structure outlined in the system prom
             "quote_count": len(summary_data.get("quotes", [])),
         }
 
-        file_path = self.storage.save_markdown(
+        file_path = await self.storage.save_markdown_async(
             content=formatted_summary,
             filename=filename,
             content_type="summary",
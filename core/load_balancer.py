@@ -150,19 +150,16 @@ class LoadBalancer:
         """
         logger.warning(f"Agent {agent_id} reported failure: {error}")
 
-        # Get agent and mark as unhealthy
-        agent = self.state_manager.get_agent(agent_id)
-        if agent:
-            agent.healthy = False
-            self.state_manager.register_agent(agent)
+        # Mark as unhealthy; only the health field is written so task counts
+        # and heartbeats updated concurrently are left intact
+        self.state_manager.set_agent_health(agent_id, False)
 
     def report_agent_success(self, agent_id: str):
         """Report successful agent execution"""
         agent = self.state_manager.get_agent(agent_id)
         if agent and not agent.healthy:
             # Restore health if it was marked unhealthy
-            agent.healthy = True
-            self.state_manager.register_agent(agent)
+            self.state_manager.set_agent_health(agent_id, True)
 
     def get_agent_stats(self, agent_type: str) -> dict:
         """Get statistics for agents of a specific type"""
@@ -96,6 +96,7 @@ class Orchestrator:
             task.cancel()
 
         self.executor.shutdown(wait=True)
+        self.state_manager.close()
         logger.info("Orchestrator stopped")
 
     async def submit_task(self, task_def: TaskDefinition) -> Dict[str, Any]:
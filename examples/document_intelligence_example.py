@@ -227,6 +227,7 @@ async def example_5_summarize_document(document):
     }
 
     result = await agent.process(inputs, parameters)
+    await agent.shutdown()
 
     if result.data['summaries']:
         summary = result.data['summaries'][0]
@@ -281,6 +282,7 @@ async def example_6_synthesize_documents(document_summaries):
     }
 
     result = await agent.process(inputs, parameters)
+    await agent.shutdown()
 
     print(f"\nIntelligence synthesis complete!")
     print(f"  Documents analyzed: {result.data['summary_count']}")
@@ -117,6 +117,7 @@ async def example_2_transcribe_podcast(episode_data):
     }
 
     result = await agent.process(inputs, parameters)
+    await agent.shutdown()
 
     print(f"\nTranscription complete!")
     print(f"Success: {result.data['success_count']}")
@@ -172,6 +173,7 @@ async def example_3_summarize_transcript(transcript_info):
     }
 
     result = await agent.process(inputs, parameters)
+    await agent.shutdown()
 
     print(f"\nSummary generated!")
     print(f"LLM Model: {result.metadata['llm_model']}")
@@ -237,6 +239,7 @@ async def example_4_synthesize_intelligence(summaries):
     }
 
     result = await agent.process(inputs, parameters)
+    await agent.shutdown()
 
     print(f"\nIntelligence synthesis complete!")
     print(f"Summaries analyzed: {result.data['summary_count']}")
@@ -3,9 +3,11 @@ Metrics Collection and Monitoring
 Prometheus-compatible metrics for production monitoring
 """
 
+import io
+import math
 import time
-from typing import Dict, Any, List
-from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Tuple
+from collections import defaultdict
 import threading
 import logging
 from dataclasses import dataclass, field
@@ -23,18 +25,157 @@ class MetricData:
     timestamp: float = field(default_factory=time.time)
 
 
+class QuantileSketch:
+    """
+    Streaming quantile sketch (DDSketch) with bounded relative error
+    Values are counted in logarithmically sized buckets, so memory is
+    O(log(max/min) / accuracy) regardless of how many samples are recorded
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = defaultdict(int)
+        self._negative: Dict[int, int] = defaultdict(int)
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        """Bucket index for a strictly positive value"""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket (within relative_accuracy of every member)"""
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float):
+        """Add a sample to the sketch"""
+        if value > 0:
+            self._positive[self._index(value)] += 1
+        elif value < 0:
+            self._negative[self._index(-value)] += 1
+        else:
+            self._zero_count += 1
+
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def get_quantile_value(self, quantile: float) -> float:
+        """Estimate the value at the given quantile (0.0 - 1.0)"""
+        return self.get_quantile_values([quantile])[0]
+
+    def get_quantile_values(self, quantiles: List[float]) -> List[float]:
+        """
+        Estimate several quantiles in one ascending pass over the buckets
+        Quantiles must be given in ascending order
+        """
+        if self.count == 0:
+            return [0.0] * len(quantiles)
+
+        ranks = [min(int(q * self.count), self.count - 1) for q in quantiles]
+        results = []
+        seen = 0
+
+        def fill(bucket_count: int, value: float):
+            nonlocal seen
+            seen += bucket_count
+            # Bucket midpoints can fall outside the observed range
+            value = min(max(value, self.min), self.max)
+            while len(results) < len(ranks) and seen > ranks[len(results)]:
+                results.append(value)
+
+        for index in sorted(self._negative, reverse=True):
+            fill(self._negative[index], -self._bucket_value(index))
+        fill(self._zero_count, 0.0)
+        for index in sorted(self._positive):
+            if len(results) == len(ranks):
+                break
+            fill(self._positive[index], self._bucket_value(index))
+
+        results.extend([self.max] * (len(ranks) - len(results)))
+        return results
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of all metrics, shared by the read and export paths"""
+    counters: Dict[str, float]
+    gauges: Dict[str, float]
+    histograms: Dict[str, Dict[str, float]]
+    uptime_seconds: float
+
+
+class BoundMetric:
+    """
+    Metric handle bound to a fixed name and label set
+    The key is composed once at bind time, so hot paths skip label formatting
+    """
+
+    def __init__(self, collector: "MetricsCollector", key: str):
+        self._collector = collector
+        self.key = key
+
+    def inc(self, value: float = 1.0):
+        """Increment the bound counter"""
+        self._collector._increment_key(self.key, value)
+
+    def dec(self, value: float = 1.0):
+        """Decrement the bound counter"""
+        self._collector._increment_key(self.key, -value)
+
+    def set(self, value: float):
+        """Set the bound gauge"""
+        self._collector._set_gauge_key(self.key, value)
+
+    def observe(self, value: float):
+        """Record a value in the bound histogram"""
+        self._collector._record_key(self.key, value)
+
+
 class MetricsCollector:
     """
     Collects and exposes metrics for monitoring
     Thread-safe implementation for concurrent access
+
+    Writers lock one of LOCK_STRIPES stripes chosen by metric key, so updates
+    to different metrics don't contend. Readers of counters and gauges take no
+    lock: single dict reads and copies are atomic under the GIL, and values
+    that are microseconds stale are fine for monitoring.
     """
 
-    def __init__(self, max_histogram_samples: int = 1000):
-        self._lock = threading.Lock()
+    LOCK_STRIPES = 16
+
+    # Scrapes of several endpoints within this window share one snapshot
+    SNAPSHOT_MAX_AGE_SECONDS = 0.1
+
+    # Bound the metric key cache in case labels carry high-cardinality values
+    MAX_CACHED_KEYS = 4096
+
+    def __init__(self, histogram_relative_accuracy: float = 0.01):
+        self._locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
         self._counters: Dict[str, float] = defaultdict(float)
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_histogram_samples))
-        self._start_time = time.time()
+        self._histograms: Dict[str, QuantileSketch] = defaultdict(
+            lambda: QuantileSketch(histogram_relative_accuracy)
+        )
+        self._start_time = time.monotonic()
+
+        # Prometheus "# TYPE" lines, keyed by (metric type, name)
+        self._type_lines: Dict[Tuple[str, str], str] = {}
+
+        # Composed metric keys, keyed by (name, frozenset of label items)
+        self._key_cache: Dict[Tuple[str, frozenset], str] = {}
+
+        self._last_snapshot: Optional[MetricsSnapshot] = None
+        self._last_snapshot_ts = 0.0
 
         # Initialize standard metrics
         self._initialize_metrics()
@@ -49,12 +190,13 @@ class MetricsCollector:
         self._counters["tasks_running"] = 0
         self._counters["tasks_under_500ms"] = 0
 
+    def bind(self, metric_name: str, labels: Dict[str, str] = None) -> BoundMetric:
+        """Get a handle for repeated updates of one metric/label combination"""
+        return BoundMetric(self, self._key_for(metric_name, labels))
+
     def increment(self, metric_name: str, value: float = 1.0, labels: Dict[str, str] = None):
         """Increment a counter metric"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            self._counters[key] += value
-            logger.debug(f"Incremented {key} by {value} (now {self._counters[key]})")
+        self._increment_key(self._key_for(metric_name, labels), value)
 
     def decrement(self, metric_name: str, value: float = 1.0, labels: Dict[str, str] = None):
         """Decrement a counter metric"""
@@ -62,152 +204,209 @@ class MetricsCollector:
 
     def set_gauge(self, metric_name: str, value: float, labels: Dict[str, str] = None):
         """Set a gauge metric to a specific value"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            self._gauges[key] = value
-            logger.debug(f"Set gauge {key} to {value}")
+        self._set_gauge_key(self._key_for(metric_name, labels), value)
 
     def record(self, metric_name: str, value: float, labels: Dict[str, str] = None):
         """Record a value in histogram (for percentiles, averages, etc.)"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            self._histograms[key].append({
-                "value": value,
-                "timestamp": time.time()
-            })
+        self._record_key(self._key_for(metric_name, labels), value)
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) % self.LOCK_STRIPES]
+
+    def _increment_key(self, key: str, value: float):
+        with self._lock_for(key):
+            self._counters[key] += value
+            new_value = self._counters[key]
+        logger.debug("Incremented %s by %s (now %s)", key, value, new_value)
+
+    def _set_gauge_key(self, key: str, value: float):
+        with self._lock_for(key):
+            self._gauges[key] = value
+        logger.debug("Set gauge %s to %s", key, value)
+
+    def _record_key(self, key: str, value: float):
+        with self._lock_for(key):
+            self._histograms[key].add(value)
 
     def get_counter(self, metric_name: str, labels: Dict[str, str] = None) -> float:
         """Get current value of a counter"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            return self._counters.get(key, 0.0)
+        return self._counters.get(self._key_for(metric_name, labels), 0.0)
 
     def get_gauge(self, metric_name: str, labels: Dict[str, str] = None) -> float:
         """Get current value of a gauge"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            return self._gauges.get(key, 0.0)
+        return self._gauges.get(self._key_for(metric_name, labels), 0.0)
 
     def get_histogram_stats(self, metric_name: str, labels: Dict[str, str] = None) -> Dict[str, float]:
         """Get statistics from histogram (mean, p50, p95, p99)"""
-        with self._lock:
-            key = self._make_key(metric_name, labels)
-            samples = self._histograms.get(key, deque())
-
-            if not samples:
-                return {
-                    "count": 0,
-                    "mean": 0.0,
-                    "p50": 0.0,
-                    "p95": 0.0,
-                    "p99": 0.0,
-                    "min": 0.0,
-                    "max": 0.0
-                }
-
-            values = sorted([s["value"] for s in samples])
-            count = len(values)
+        key = self._key_for(metric_name, labels)
+        with self._lock_for(key):
+            return self._histogram_stats(key)
 
+    def _histogram_stats(self, key: str) -> Dict[str, float]:
+        """Summarize a histogram sketch (caller must hold the key's lock)"""
+        sketch = self._histograms.get(key)
+
+        if sketch is None or sketch.count == 0:
             return {
-                "count": count,
-                "mean": sum(values) / count,
-                "p50": self._percentile(values, 50),
-                "p95": self._percentile(values, 95),
-                "p99": self._percentile(values, 99),
-                "min": values[0],
-                "max": values[-1]
+                "count": 0,
+                "mean": 0.0,
+                "p50": 0.0,
+                "p95": 0.0,
+                "p99": 0.0,
+                "min": 0.0,
+                "max": 0.0
             }
 
-    def _percentile(self, sorted_values: List[float], percentile: int) -> float:
-        """Calculate percentile from sorted values"""
-        if not sorted_values:
-            return 0.0
+        p50, p95, p99 = sketch.get_quantile_values([0.50, 0.95, 0.99])
 
-        index = int((percentile / 100.0) * len(sorted_values))
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
+        return {
+            "count": sketch.count,
+            "mean": sketch.sum / sketch.count,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "min": sketch.min,
+            "max": sketch.max
+        }
 
-    def _make_key(self, metric_name: str, labels: Dict[str, str] = None) -> str:
-        """Create metric key with labels"""
+    def _key_for(self, metric_name: str, labels: Dict[str, str] = None) -> str:
+        """Look up (or compose and cache) the metric key for a labels dict"""
         if not labels:
             return metric_name
 
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        cache_key = (metric_name, frozenset(labels.items()))
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            key = self._make_key(metric_name, tuple(sorted(labels.items())))
+            if len(self._key_cache) >= self.MAX_CACHED_KEYS:
+                self._key_cache.clear()
+            self._key_cache[cache_key] = key
+        return key
+
+    @staticmethod
+    def _make_key(metric_name: str, label_items: Tuple[Tuple[str, str], ...] = ()) -> str:
+        """Create metric key from a name and pre-sorted label items"""
+        if not label_items:
+            return metric_name
+
+        label_str = ",".join(f"{k}={v}" for k, v in label_items)
         return f"{metric_name}{{{label_str}}}"
 
+    def _snapshot(self) -> MetricsSnapshot:
+        """
+        Take (or reuse) a snapshot of all metrics
+        Snapshots are memoized for SNAPSHOT_MAX_AGE_SECONDS, so back-to-back
+        readers share one copy and one pass over the histogram sketches
+        """
+        now = time.monotonic()
+        snapshot = self._last_snapshot
+        if snapshot is not None and now - self._last_snapshot_ts < self.SNAPSHOT_MAX_AGE_SECONDS:
+            return snapshot
+
+        # Sketches hold several fields, so each is read under its own
+        # stripe; counters and gauges are copied without locking
+        histograms = {}
+        for name in list(self._histograms):
+            with self._lock_for(name):
+                histograms[name] = self._histogram_stats(name)
+
+        snapshot = MetricsSnapshot(
+            counters=dict(self._counters),
+            gauges=dict(self._gauges),
+            histograms=histograms,
+            uptime_seconds=time.monotonic() - self._start_time
+        )
+
+        self._last_snapshot = snapshot
+        self._last_snapshot_ts = now
+        return snapshot
+
     def get_all_metrics(self) -> Dict[str, Any]:
         """Get all metrics for export"""
-        with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {
-                    name: self.get_histogram_stats(name.split("{")[0])
-                    for name in self._histograms.keys()
-                },
-                "uptime_seconds": time.time() - self._start_time
-            }
+        snapshot = self._snapshot()
+        return {
+            "counters": dict(snapshot.counters),
+            "gauges": dict(snapshot.gauges),
+            "histograms": {name: dict(stats) for name, stats in snapshot.histograms.items()},
+            "uptime_seconds": snapshot.uptime_seconds
+        }
 
     def get_task_metrics(self) -> Dict[str, Any]:
         """Get task-specific metrics for monitoring"""
-        with self._lock:
-            total_submitted = self._counters.get("tasks_submitted", 0)
-            total_completed = self._counters.get("tasks_completed", 0)
-            total_failed = self._counters.get("tasks_failed", 0)
-            total_cancelled = self._counters.get("tasks_cancelled", 0)
-            under_500ms = self._counters.get("tasks_under_500ms", 0)
-
-            # Calculate success rate
-            total_terminal = total_completed + total_failed + total_cancelled
-            success_rate = (total_completed / total_terminal * 100) if total_terminal > 0 else 0.0
-
-            # Calculate error rate
-            error_rate = (total_failed / total_terminal * 100) if total_terminal > 0 else 0.0
-
-            # Get latency stats
-            latency_stats = self.get_histogram_stats("task_execution_time_ms")
+        return self._task_metrics(self._snapshot())
+
+    def _task_metrics(self, snapshot: MetricsSnapshot) -> Dict[str, Any]:
+        counters = snapshot.counters
+        total_submitted = counters.get("tasks_submitted", 0)
+        total_completed = counters.get("tasks_completed", 0)
+        total_failed = counters.get("tasks_failed", 0)
+        total_cancelled = counters.get("tasks_cancelled", 0)
+        under_500ms = counters.get("tasks_under_500ms", 0)
+
+        # Calculate success rate
+        total_terminal = total_completed + total_failed + total_cancelled
+        success_rate = (total_completed / total_terminal * 100) if total_terminal > 0 else 0.0
+
+        # Calculate error rate
+        error_rate = (total_failed / total_terminal * 100) if total_terminal > 0 else 0.0
+
+        # Get latency stats
+        latency_stats = snapshot.histograms.get("task_execution_time_ms")
+        if latency_stats is None:
+            latency_stats = self._histogram_stats("task_execution_time_ms")
+
+        return {
+            "tasks_submitted": total_submitted,
+            "tasks_completed": total_completed,
+            "tasks_failed": total_failed,
+            "tasks_cancelled": total_cancelled,
+            "tasks_under_500ms": under_500ms,
+            "success_rate_percent": success_rate,
+            "error_rate_percent": error_rate,
+            "latency_ms": dict(latency_stats),
+            "uptime_seconds": snapshot.uptime_seconds
+        }
 
-            return {
-                "tasks_submitted": total_submitted,
-                "tasks_completed": total_completed,
-                "tasks_failed": total_failed,
-                "tasks_cancelled": total_cancelled,
-                "tasks_under_500ms": under_500ms,
-                "success_rate_percent": success_rate,
-                "error_rate_percent": error_rate,
-                "latency_ms": latency_stats,
-                "uptime_seconds": time.time() - self._start_time
-            }
+    def _type_line(self, metric_type: str, name: str) -> str:
+        """Cached "# TYPE" header line for a metric"""
+        line = self._type_lines.get((metric_type, name))
+        if line is None:
+            line = f"# TYPE {name} {metric_type}\n"
+            self._type_lines[(metric_type, name)] = line
+        return line
 
     def export_prometheus_format(self) -> str:
         """
         Export metrics in Prometheus text format
         For production integration with Prometheus
         """
-        lines = []
+        snapshot = self._snapshot()
+
+        out = io.StringIO()
+        write = out.write
 
         # Export counters
-        for name, value in self._counters.items():
-            lines.append(f"# TYPE {name} counter")
-            lines.append(f"{name} {value}")
+        for name, value in snapshot.counters.items():
+            write(self._type_line("counter", name))
+            write(f"{name} {value}\n")
 
         # Export gauges
-        for name, value in self._gauges.items():
-            lines.append(f"# TYPE {name} gauge")
-            lines.append(f"{name} {value}")
+        for name, value in snapshot.gauges.items():
+            write(self._type_line("gauge", name))
+            write(f"{name} {value}\n")
 
         # Export histogram summaries
-        for name in self._histograms.keys():
+        for name, stats in snapshot.histograms.items():
             metric_name = name.split("{")[0]
-            stats = self.get_histogram_stats(metric_name)
-
-            lines.append(f"# TYPE {metric_name} summary")
-            lines.append(f"{metric_name}{{quantile=\"0.5\"}} {stats['p50']}")
-            lines.append(f"{metric_name}{{quantile=\"0.95\"}} {stats['p95']}")
-            lines.append(f"{metric_name}{{quantile=\"0.99\"}} {stats['p99']}")
-            lines.append(f"{metric_name}_count {stats['count']}")
+            write(self._type_line("summary", metric_name))
+            write(
+                f"{metric_name}{{quantile=\"0.5\"}} {stats['p50']}\n"
+                f"{metric_name}{{quantile=\"0.95\"}} {stats['p95']}\n"
+                f"{metric_name}{{quantile=\"0.99\"}} {stats['p99']}\n"
+                f"{metric_name}_count {stats['count']}\n"
+            )
 
-        return "\n".join(lines)
+        return out.getvalue()
 
     def check_sla_compliance(self) -> Dict[str, bool]:
         """
@@ -227,13 +426,19 @@ class MetricsCollector:
 
     def reset(self):
         """Reset all metrics (useful for testing)"""
-        with self._lock:
+        for lock in self._locks:
+            lock.acquire()
+        try:
             self._counters.clear()
             self._gauges.clear()
             self._histograms.clear()
-            self._start_time = time.time()
+            self._start_time = time.monotonic()
+            self._last_snapshot = None
             self._initialize_metrics()
-            logger.info("Metrics reset")
+        finally:
+            for lock in self._locks:
+                lock.release()
+        logger.info("Metrics reset")
 
 
 class PerformanceMonitor:
@@ -244,13 +449,14 @@ class PerformanceMonitor:
         self.metrics = metrics_collector
         self.metric_name = metric_name
         self.labels = labels
-        self.start_time = None
+        self.start_ns = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = (time.time() - self.start_time) * 1000
-        self.metrics.record(self.metric_name, duration_ms, self.labels)
+        duration_ms = (time.perf_counter_ns() - self.start_ns) * 1e-6
+        if duration_ms > 0:
+            self.metrics.record(self.metric_name, duration_ms, self.labels)
         return False
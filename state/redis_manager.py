@@ -3,11 +3,11 @@ Redis State Manager for distributed task orchestration
 Handles task state, agent registry, and distributed locking
 """
 
-import json
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
+import orjson
 import redis
 from redis.client import Redis
 from redis.exceptions import LockError
@@ -15,6 +15,89 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes dataclasses and Enums natively; keep stdlib json's
+# tolerance for non-string dict keys and accept numpy values in agent outputs
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+# Atomically adjust an agent's task count, clamped at zero.
+# Returns -1 if the agent is not registered.
+INCREMENT_AGENT_TASKS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local tasks = redis.call('HINCRBY', KEYS[1], 'current_tasks', ARGV[1])
+if tasks < 0 then
+    redis.call('HSET', KEYS[1], 'current_tasks', 0)
+    tasks = 0
+end
+return tasks
+"""
+
+# Set one field of a registered agent's hash, without creating the hash
+# if the agent is unknown, optionally publishing the change (ARGV[3] is the
+# channel, ARGV[4] the message). Returns 0 if the agent is not registered.
+SET_AGENT_FIELD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+if ARGV[3] then
+    redis.call('PUBLISH', ARGV[3], ARGV[4])
+end
+return 1
+"""
+
+# Set a task's hot status fields (and optional error/output) and publish
+# the change in one atomic round-trip. Returns 0 if the task does not exist.
+UPDATE_TASK_STATUS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], 'updated_at', ARGV[2])
+if ARGV[3] ~= '' then
+    redis.call('HSET', KEYS[1], 'error', ARGV[3])
+end
+if ARGV[4] ~= '' then
+    redis.call('HSET', KEYS[1], 'output', ARGV[4])
+end
+redis.call('PUBLISH', ARGV[5], ARGV[6])
+return 1
+"""
+
+# Move a task stored in the old single-blob layout to the split layout.
+# ARGV: blob, status, updated_at, retry_count, error, output, executions...
+# Returns 0 if another process already migrated it.
+MIGRATE_TASK_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1])
+redis.call('HSET', KEYS[2], 'status', ARGV[2], 'updated_at', ARGV[3], 'retry_count', ARGV[4])
+if ARGV[5] ~= '' then
+    redis.call('HSET', KEYS[2], 'error', ARGV[5])
+end
+if ARGV[6] ~= '' then
+    redis.call('HSET', KEYS[2], 'output', ARGV[6])
+end
+redis.call('DEL', KEYS[3])
+if #ARGV > 6 then
+    redis.call('RPUSH', KEYS[3], unpack(ARGV, 7))
+end
+return 1
+"""
+
+# Append an agent execution record to an existing task.
+# Returns 0 if the task does not exist.
+ADD_AGENT_EXECUTION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[1], 'updated_at', ARGV[2])
+return 1
+"""
+
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -41,8 +124,17 @@ class TaskState:
     priority: int = 5
 
 
+# Direct value -> member lookup, skipping Enum.__call__ on every task read
+_TASK_STATUSES = {status.value: status for status in TaskStatus}
+
+
 @dataclass
 class AgentInfo:
+    __slots__ = (
+        'agent_id', 'agent_type', 'endpoint', 'capabilities', 'max_concurrent_tasks',
+        'current_tasks', 'healthy', 'last_heartbeat', 'metadata'
+    )
+
     agent_id: str
     agent_type: str
     endpoint: str
@@ -58,8 +150,11 @@ class RedisStateManager:
     """Manages distributed state using Redis"""
 
     def __init__(self, redis_host: str = "localhost", redis_port: int = 6379,
-                 redis_db: int = 0, redis_password: Optional[str] = None):
-        self.redis_client: Redis = redis.Redis(
+                 redis_db: int = 0, redis_password: Optional[str] = None,
+                 agent_cache_ttl: float = 0.5, max_connections: int = 64):
+        # Sized explicitly so concurrent scheduler threads don't serialize
+        # on the pool; callers wait up to 1s for a free connection
+        self.connection_pool = redis.BlockingConnectionPool(
             host=redis_host,
             port=redis_port,
             db=redis_db,
@@ -67,18 +162,59 @@ class RedisStateManager:
             decode_responses=True,
             socket_connect_timeout=5,
             socket_keepalive=True,
-            health_check_interval=30
+            health_check_interval=30,
+            max_connections=max_connections,
+            timeout=1.0
         )
+        self.redis_client: Redis = redis.Redis(connection_pool=self.connection_pool)
 
         # Key prefixes
         self.TASK_PREFIX = "task:"
+        self.TASK_STATE_PREFIX = "task_state:"
+        self.TASK_EXECUTIONS_PREFIX = "task_executions:"
         self.AGENT_PREFIX = "agent:"
+        self.AGENT_TYPE_INDEX_PREFIX = "agent_type_idx:"
         self.QUEUE_PREFIX = "queue:"
         self.LOCK_PREFIX = "lock:"
         self.METRICS_PREFIX = "metrics:"
+        self.AGENT_UPDATES_CHANNEL = "agent_updates"
+
+        # Agent keys in layouts written by older versions, as SCAN (match, type)
+        # filters; cleanup deletes them once per process. Type indexes used to
+        # be agent:type:{type} sets, now rebuilt by register_agent.
+        self.LEGACY_AGENT_KEYS = [
+            (f"{self.AGENT_PREFIX}*", "string"),
+            (f"{self.AGENT_PREFIX}type:*", "set"),
+        ]
+        self._legacy_agent_keys_removed = False
+
+        # Server-side scripts (loaded lazily by redis-py on first call)
+        self._increment_agent_tasks = self.redis_client.register_script(
+            INCREMENT_AGENT_TASKS_SCRIPT
+        )
+        self._set_agent_field = self.redis_client.register_script(
+            SET_AGENT_FIELD_SCRIPT
+        )
+        self._update_task_status = self.redis_client.register_script(
+            UPDATE_TASK_STATUS_SCRIPT
+        )
+        self._add_agent_execution = self.redis_client.register_script(
+            ADD_AGENT_EXECUTION_SCRIPT
+        )
+        self._migrate_task = self.redis_client.register_script(
+            MIGRATE_TASK_SCRIPT
+        )
+
+        # Per-process agent cache: agent_id -> (expires_at, AgentInfo)
+        self.agent_cache_ttl = agent_cache_ttl
+        self._agent_cache: Dict[str, Tuple[float, AgentInfo]] = {}
+        self._agent_listener = None
 
         self._ensure_connection()
 
+        if self.agent_cache_ttl > 0:
+            self._start_agent_listener()
+
     def _ensure_connection(self):
         """Ensure Redis connection is healthy"""
         try:
@@ -88,25 +224,76 @@ class RedisStateManager:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
 
+    def _start_agent_listener(self):
+        """Evict cached agents when another process publishes a change"""
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.AGENT_UPDATES_CHANNEL: self._on_agent_update})
+        self._agent_listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _on_agent_update(self, message: Dict[str, Any]):
+        self._agent_cache.pop(message["data"], None)
+
+    def close(self):
+        """Stop background listeners and release connections"""
+        if self._agent_listener is not None:
+            self._agent_listener.stop()
+            self._agent_listener = None
+        self._agent_cache.clear()
+        self.redis_client.close()
+        self.connection_pool.disconnect()
+
     # Task State Management
+    #
+    # A task is split across three keys so hot updates never touch the
+    # full record:
+    #   task:{id}             JSON blob of immutable fields (type, metadata, ...)
+    #   task_state:{id}       hash of mutable fields (status, updated_at, ...)
+    #   task_executions:{id}  list of JSON agent execution records
+    #
+    # Tasks written by older versions keep everything in the task:{id} blob
+    # and have no task_state hash; they are migrated on first access.
 
     def create_task(self, task_state: TaskState) -> bool:
         """Create a new task in Redis"""
         try:
-            task_key = f"{self.TASK_PREFIX}{task_state.task_id}"
-            task_data = asdict(task_state)
-            task_data['status'] = task_state.status.value
+            task_id = task_state.task_id
+            state_key = f"{self.TASK_STATE_PREFIX}{task_id}"
+            executions_key = f"{self.TASK_EXECUTIONS_PREFIX}{task_id}"
+
+            task_data = {
+                "task_id": task_id,
+                "task_type": task_state.task_type,
+                "created_at": task_state.created_at,
+                "metadata": task_state.metadata,
+                "priority": task_state.priority
+            }
+            state_data = {
+                "status": task_state.status.value,
+                "updated_at": repr(task_state.updated_at),
+                "retry_count": task_state.retry_count
+            }
+            if task_state.error is not None:
+                state_data["error"] = orjson.dumps(task_state.error, option=ORJSON_OPTIONS)
+            if task_state.output is not None:
+                state_data["output"] = orjson.dumps(task_state.output, option=ORJSON_OPTIONS)
 
             # Use pipeline for atomic operations
             pipe = self.redis_client.pipeline()
-            pipe.set(task_key, json.dumps(task_data))
+            pipe.set(f"{self.TASK_PREFIX}{task_id}", orjson.dumps(task_data, option=ORJSON_OPTIONS))
+            pipe.delete(state_key, executions_key)
+            pipe.hset(state_key, mapping=state_data)
+            if task_state.agent_executions:
+                pipe.rpush(executions_key, *[
+                    orjson.dumps(execution, option=ORJSON_OPTIONS)
+                    for execution in task_state.agent_executions
+                ])
             pipe.zadd(
                 f"{self.QUEUE_PREFIX}{task_state.task_type}",
-                {task_state.task_id: task_state.priority}
+                {task_id: task_state.priority}
             )
             pipe.execute()
 
-            logger.info(f"Task {task_state.task_id} created with status {task_state.status.value}")
+            logger.info(f"Task {task_id} created with status {task_state.status.value}")
             return True
         except Exception as e:
             logger.error(f"Failed to create task {task_state.task_id}: {e}")
@@ -115,15 +302,35 @@ class RedisStateManager:
     def get_task(self, task_id: str) -> Optional[TaskState]:
         """Get task state from Redis"""
         try:
-            task_key = f"{self.TASK_PREFIX}{task_id}"
-            task_data = self.redis_client.get(task_key)
+            pipe = self.redis_client.pipeline()
+            pipe.get(f"{self.TASK_PREFIX}{task_id}")
+            pipe.hgetall(f"{self.TASK_STATE_PREFIX}{task_id}")
+            pipe.lrange(f"{self.TASK_EXECUTIONS_PREFIX}{task_id}", 0, -1)
+            task_data, state_data, executions = pipe.execute()
 
             if not task_data:
                 return None
 
-            data = json.loads(task_data)
-            data['status'] = TaskStatus(data['status'])
-            return TaskState(**data)
+            data = orjson.loads(task_data)
+            if not state_data:
+                return self._migrate_legacy_task(task_id, data)
+
+            error = state_data.get('error')
+            output = state_data.get('output')
+
+            return TaskState(
+                task_id=data['task_id'],
+                status=_TASK_STATUSES[state_data['status']],
+                task_type=data['task_type'],
+                created_at=data['created_at'],
+                updated_at=float(state_data['updated_at']),
+                agent_executions=[orjson.loads(execution) for execution in executions],
+                metadata=data['metadata'],
+                output=orjson.loads(output) if output else None,
+                error=orjson.loads(error) if error else None,
+                retry_count=int(state_data['retry_count']),
+                priority=data['priority']
+            )
         except Exception as e:
             logger.error(f"Failed to get task {task_id}: {e}")
             return None
@@ -133,32 +340,25 @@ class RedisStateManager:
                           output: Optional[Dict] = None) -> bool:
         """Update task status atomically"""
         try:
-            task_key = f"{self.TASK_PREFIX}{task_id}"
-            task = self.get_task(task_id)
+            now = time.time()
+            keys = [f"{self.TASK_STATE_PREFIX}{task_id}"]
+            args = [
+                status.value,
+                repr(now),
+                orjson.dumps(error, option=ORJSON_OPTIONS) if error else "",
+                orjson.dumps(output, option=ORJSON_OPTIONS) if output else "",
+                f"task_updates:{task_id}",
+                orjson.dumps({"status": status.value, "timestamp": now})
+            ]
+
+            updated = self._update_task_status(keys=keys, args=args)
+            if not updated and self._migrate_legacy_task(task_id) is not None:
+                updated = self._update_task_status(keys=keys, args=args)
 
-            if not task:
+            if not updated:
                 logger.warning(f"Task {task_id} not found")
                 return False
 
-            task.status = status
-            task.updated_at = time.time()
-
-            if error:
-                task.error = error
-            if output:
-                task.output = output
-
-            task_data = asdict(task)
-            task_data['status'] = status.value
-
-            self.redis_client.set(task_key, json.dumps(task_data))
-
-            # Publish update to subscribers
-            self.redis_client.publish(
-                f"task_updates:{task_id}",
-                json.dumps({"status": status.value, "timestamp": time.time()})
-            )
-
             logger.info(f"Task {task_id} status updated to {status.value}")
             return True
         except Exception as e:
@@ -168,23 +368,74 @@ class RedisStateManager:
     def add_agent_execution(self, task_id: str, agent_execution: Dict[str, Any]) -> bool:
         """Add agent execution info to task"""
         try:
-            task = self.get_task(task_id)
-            if not task:
-                return False
-
-            task.agent_executions.append(agent_execution)
-            task.updated_at = time.time()
-
-            task_key = f"{self.TASK_PREFIX}{task_id}"
-            task_data = asdict(task)
-            task_data['status'] = task.status.value
-
-            self.redis_client.set(task_key, json.dumps(task_data))
-            return True
+            keys = [
+                f"{self.TASK_STATE_PREFIX}{task_id}",
+                f"{self.TASK_EXECUTIONS_PREFIX}{task_id}"
+            ]
+            args = [orjson.dumps(agent_execution, option=ORJSON_OPTIONS), repr(time.time())]
+
+            added = self._add_agent_execution(keys=keys, args=args)
+            if not added and self._migrate_legacy_task(task_id) is not None:
+                added = self._add_agent_execution(keys=keys, args=args)
+            return bool(added)
         except Exception as e:
             logger.error(f"Failed to add agent execution for task {task_id}: {e}")
             return False
 
+    def _migrate_legacy_task(self, task_id: str,
+                             data: Optional[Dict[str, Any]] = None) -> Optional[TaskState]:
+        """
+        Split a task stored as a single blob (pre task_state layout) into
+        the current keys. Returns the task, or None if it is not a legacy task
+        """
+        if data is None:
+            task_data = self.redis_client.get(f"{self.TASK_PREFIX}{task_id}")
+            if not task_data:
+                return None
+            data = orjson.loads(task_data)
+
+        if 'status' not in data:
+            return None
+
+        task = TaskState(
+            task_id=data['task_id'],
+            status=_TASK_STATUSES[data['status']],
+            task_type=data['task_type'],
+            created_at=data['created_at'],
+            updated_at=data['updated_at'],
+            agent_executions=data.get('agent_executions') or [],
+            metadata=data.get('metadata') or {},
+            output=data.get('output'),
+            error=data.get('error'),
+            retry_count=data.get('retry_count', 0),
+            priority=data.get('priority', 5)
+        )
+
+        self._migrate_task(
+            keys=[
+                f"{self.TASK_PREFIX}{task_id}",
+                f"{self.TASK_STATE_PREFIX}{task_id}",
+                f"{self.TASK_EXECUTIONS_PREFIX}{task_id}"
+            ],
+            args=[
+                orjson.dumps({
+                    "task_id": task.task_id,
+                    "task_type": task.task_type,
+                    "created_at": task.created_at,
+                    "metadata": task.metadata,
+                    "priority": task.priority
+                }, option=ORJSON_OPTIONS),
+                task.status.value,
+                repr(task.updated_at),
+                task.retry_count,
+                orjson.dumps(task.error, option=ORJSON_OPTIONS) if task.error is not None else "",
+                orjson.dumps(task.output, option=ORJSON_OPTIONS) if task.output is not None else "",
+                *[orjson.dumps(execution, option=ORJSON_OPTIONS) for execution in task.agent_executions]
+            ]
+        )
+        logger.info(f"Task {task_id} migrated to split task_state layout")
+        return task
+
     # Queue Management
 
     def get_next_task(self, task_type: str) -> Optional[str]:
@@ -212,20 +463,59 @@ class RedisStateManager:
             return 0
 
     # Agent Registry
+    #
+    # Agents are stored as Redis hashes so single fields (heartbeat, task
+    # count) can be updated in place without a read-modify-write cycle
+
+    @staticmethod
+    def _agent_to_hash(agent_info: AgentInfo) -> Dict[str, Any]:
+        """Flatten AgentInfo into Redis hash fields"""
+        return {
+            'agent_id': agent_info.agent_id,
+            'agent_type': agent_info.agent_type,
+            'endpoint': agent_info.endpoint,
+            'capabilities': orjson.dumps(agent_info.capabilities),
+            'max_concurrent_tasks': agent_info.max_concurrent_tasks,
+            'current_tasks': agent_info.current_tasks,
+            'healthy': int(agent_info.healthy),
+            'last_heartbeat': agent_info.last_heartbeat,
+            'metadata': orjson.dumps(agent_info.metadata, option=ORJSON_OPTIONS)
+        }
+
+    @staticmethod
+    def _agent_from_hash(agent_data: Dict[str, str]) -> AgentInfo:
+        """Rebuild AgentInfo from Redis hash fields"""
+        return AgentInfo(
+            agent_id=agent_data['agent_id'],
+            agent_type=agent_data['agent_type'],
+            endpoint=agent_data['endpoint'],
+            capabilities=orjson.loads(agent_data['capabilities']),
+            max_concurrent_tasks=int(agent_data['max_concurrent_tasks']),
+            current_tasks=int(agent_data['current_tasks']),
+            healthy=agent_data['healthy'] == '1',
+            last_heartbeat=float(agent_data['last_heartbeat']),
+            metadata=orjson.loads(agent_data['metadata'])
+        )
 
     def register_agent(self, agent_info: AgentInfo) -> bool:
         """Register an agent"""
         try:
             agent_key = f"{self.AGENT_PREFIX}{agent_info.agent_id}"
-            agent_data = asdict(agent_info)
 
-            self.redis_client.set(agent_key, json.dumps(agent_data))
-
-            # Add to agent type index
-            self.redis_client.sadd(
-                f"{self.AGENT_PREFIX}type:{agent_info.agent_type}",
+            # Store, index and announce the agent in one round-trip; the DEL
+            # drops a record left in the old JSON-string layout, which would
+            # otherwise make HSET fail with WRONGTYPE
+            pipe = self.redis_client.pipeline()
+            pipe.delete(agent_key)
+            pipe.hset(agent_key, mapping=self._agent_to_hash(agent_info))
+            pipe.sadd(
+                f"{self.AGENT_TYPE_INDEX_PREFIX}{agent_info.agent_type}",
                 agent_info.agent_id
             )
+            pipe.publish(self.AGENT_UPDATES_CHANNEL, agent_info.agent_id)
+            pipe.execute()
+
+            self._cache_agent(replace(agent_info))
 
             logger.info(f"Agent {agent_info.agent_id} registered")
             return True
@@ -233,16 +523,39 @@ class RedisStateManager:
             logger.error(f"Failed to register agent {agent_info.agent_id}: {e}")
             return False
 
+    def _cache_agent(self, agent: AgentInfo):
+        if self.agent_cache_ttl > 0:
+            self._agent_cache[agent.agent_id] = (time.monotonic() + self.agent_cache_ttl, agent)
+
+    def _get_cached_agent(self, agent_id: str) -> Optional[AgentInfo]:
+        """Return a copy of a cached agent, or None if missing or expired"""
+        cached = self._agent_cache.get(agent_id)
+        if cached is None:
+            return None
+
+        expires_at, agent = cached
+        if time.monotonic() >= expires_at:
+            self._agent_cache.pop(agent_id, None)
+            return None
+
+        return replace(agent)
+
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
         """Get agent information"""
+        cached = self._get_cached_agent(agent_id)
+        if cached is not None:
+            return cached
+
         try:
             agent_key = f"{self.AGENT_PREFIX}{agent_id}"
-            agent_data = self.redis_client.get(agent_key)
+            agent_data = self.redis_client.hgetall(agent_key)
 
             if not agent_data:
                 return None
 
-            return AgentInfo(**json.loads(agent_data))
+            agent = self._agent_from_hash(agent_data)
+            self._cache_agent(replace(agent))
+            return agent
         except Exception as e:
             logger.error(f"Failed to get agent {agent_id}: {e}")
             return None
@@ -251,16 +564,31 @@ class RedisStateManager:
         """Get all agents of a specific type"""
         try:
             agent_ids = self.redis_client.smembers(
-                f"{self.AGENT_PREFIX}type:{agent_type}"
+                f"{self.AGENT_TYPE_INDEX_PREFIX}{agent_type}"
             )
 
             agents = []
+            missing_ids = []
             for agent_id in agent_ids:
-                agent = self.get_agent(agent_id)
-                if agent and agent.healthy:
-                    agents.append(agent)
-
-            return agents
+                cached = self._get_cached_agent(agent_id)
+                if cached is not None:
+                    agents.append(cached)
+                else:
+                    missing_ids.append(agent_id)
+
+            if missing_ids:
+                # Fetch all uncached agent records in a single round-trip
+                pipe = self.redis_client.pipeline()
+                for agent_id in missing_ids:
+                    pipe.hgetall(f"{self.AGENT_PREFIX}{agent_id}")
+
+                for agent_data in pipe.execute():
+                    if agent_data:
+                        agent = self._agent_from_hash(agent_data)
+                        self._cache_agent(replace(agent))
+                        agents.append(agent)
+
+            return [agent for agent in agents if agent.healthy]
         except Exception as e:
             logger.error(f"Failed to get agents by type {agent_type}: {e}")
             return []
@@ -268,29 +596,40 @@ class RedisStateManager:
     def update_agent_heartbeat(self, agent_id: str) -> bool:
         """Update agent heartbeat timestamp"""
         try:
-            agent = self.get_agent(agent_id)
-            if not agent:
-                return False
-
-            agent.last_heartbeat = time.time()
             agent_key = f"{self.AGENT_PREFIX}{agent_id}"
-            self.redis_client.set(agent_key, json.dumps(asdict(agent)))
-            return True
+            self._agent_cache.pop(agent_id, None)
+
+            # Existence check and write happen atomically server-side, so an
+            # unknown agent is rejected without creating (or deleting) its hash
+            return bool(self._set_agent_field(
+                keys=[agent_key], args=['last_heartbeat', repr(time.time())]
+            ))
         except Exception as e:
             logger.error(f"Failed to update heartbeat for agent {agent_id}: {e}")
             return False
 
+    def set_agent_health(self, agent_id: str, healthy: bool) -> bool:
+        """Mark an agent healthy or unhealthy without rewriting its record"""
+        try:
+            agent_key = f"{self.AGENT_PREFIX}{agent_id}"
+            self._agent_cache.pop(agent_id, None)
+
+            # Publish so other processes drop their cached copy
+            return bool(self._set_agent_field(
+                keys=[agent_key],
+                args=['healthy', int(healthy), self.AGENT_UPDATES_CHANNEL, agent_id]
+            ))
+        except Exception as e:
+            logger.error(f"Failed to update health for agent {agent_id}: {e}")
+            return False
+
     def increment_agent_tasks(self, agent_id: str, increment: int = 1) -> bool:
         """Increment/decrement agent current task count"""
         try:
-            agent = self.get_agent(agent_id)
-            if not agent:
-                return False
-
-            agent.current_tasks = max(0, agent.current_tasks + increment)
             agent_key = f"{self.AGENT_PREFIX}{agent_id}"
-            self.redis_client.set(agent_key, json.dumps(asdict(agent)))
-            return True
+            self._agent_cache.pop(agent_id, None)
+            current_tasks = self._increment_agent_tasks(keys=[agent_key], args=[increment])
+            return current_tasks >= 0
         except Exception as e:
             logger.error(f"Failed to update task count for agent {agent_id}: {e}")
             return False
@@ -357,30 +696,78 @@ class RedisStateManager:
 
     # Cleanup
 
-    def cleanup_stale_agents(self, max_age_seconds: int = 60):
+    def cleanup_stale_agents(self, max_age_seconds: int = 60, batch_size: int = 100):
         """Remove stale agents that haven't sent heartbeat"""
         try:
             current_time = time.time()
             agent_pattern = f"{self.AGENT_PREFIX}*"
 
-            for key in self.redis_client.scan_iter(match=agent_pattern, count=100):
-                if key.startswith(f"{self.AGENT_PREFIX}type:"):
-                    continue
-
-                agent_data = self.redis_client.get(key)
-                if agent_data:
-                    agent = AgentInfo(**json.loads(agent_data))
-                    if current_time - agent.last_heartbeat > max_age_seconds:
-                        # Remove stale agent
-                        self.redis_client.delete(key)
-                        self.redis_client.srem(
-                            f"{self.AGENT_PREFIX}type:{agent.agent_type}",
-                            agent.agent_id
-                        )
-                        logger.warning(f"Removed stale agent {agent.agent_id}")
+            if not self._legacy_agent_keys_removed:
+                self._remove_legacy_agent_keys(batch_size)
+
+            # Type indexes live outside the agent: namespace and are sets,
+            # so MATCH and TYPE filter everything but agent hashes server-side
+            batch = []
+            for key in self.redis_client.scan_iter(match=agent_pattern, count=500, _type="hash"):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    self._remove_stale_agents(batch, current_time, max_age_seconds)
+                    batch = []
+
+            if batch:
+                self._remove_stale_agents(batch, current_time, max_age_seconds)
         except Exception as e:
             logger.error(f"Failed to cleanup stale agents: {e}")
 
+    def _remove_legacy_agent_keys(self, batch_size: int):
+        """Delete agent keys left in layouts written by older versions"""
+        removed = 0
+        for pattern, key_type in self.LEGACY_AGENT_KEYS:
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=500, _type=key_type):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    removed += self.redis_client.delete(*batch)
+                    batch = []
+
+            if batch:
+                removed += self.redis_client.delete(*batch)
+
+        self._legacy_agent_keys_removed = True
+        if removed:
+            logger.warning(f"Removed {removed} legacy agent keys")
+
+    def _remove_stale_agents(self, agent_keys: List[str], current_time: float,
+                             max_age_seconds: int):
+        """Fetch a batch of agent records and remove the stale ones"""
+        pipe = self.redis_client.pipeline()
+        for key in agent_keys:
+            pipe.hmget(key, 'agent_id', 'agent_type', 'last_heartbeat')
+
+        stale_agents = []
+        for fields in pipe.execute():
+            # Skip agents removed since the scan
+            if not fields[0]:
+                continue
+
+            agent_id, agent_type, last_heartbeat = fields
+            if current_time - float(last_heartbeat) > max_age_seconds:
+                stale_agents.append((agent_id, agent_type))
+
+        if not stale_agents:
+            return
+
+        pipe = self.redis_client.pipeline()
+        for agent_id, agent_type in stale_agents:
+            pipe.delete(f"{self.AGENT_PREFIX}{agent_id}")
+            pipe.srem(f"{self.AGENT_TYPE_INDEX_PREFIX}{agent_type}", agent_id)
+            pipe.publish(self.AGENT_UPDATES_CHANNEL, agent_id)
+        pipe.execute()
+
+        for agent_id, _ in stale_agents:
+            self._agent_cache.pop(agent_id, None)
+            logger.warning(f"Removed stale agent {agent_id}")
+
     def health_check(self) -> bool:
         """Check Redis connection health"""
         try:
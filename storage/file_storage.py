@@ -3,15 +3,80 @@ File storage utilities for agent outputs.
 Supports markdown files with metadata and organized directory structure.
 """
 import os
+import re
 import json
+import time
+import asyncio
+import threading
+import functools
+import itertools
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional here
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Leading "---" frontmatter block; group 1 holds its lines
+_FRONTMATTER_RE = re.compile(r"\A---\n((?:.*\n)*?)---\n")
+
+# Lines of a YAML key/value block: "key: value" entries, each optionally
+# followed by indented or "- " continuation lines (nested values, lists)
+_YAML_KEY_RE = re.compile(r"[A-Za-z_][\w.-]*:(?: |$)")
+_YAML_CONTINUATION_RE = re.compile(r"(?:\s+\S|- )")
+
+# Frontmatter entry holding saved metadata as one JSON object (valid YAML
+# flow mapping). Only this line is ever added to or removed from a document.
+_METADATA_FIELD = "storage_metadata"
+
+# fdatasync is Linux-only; fall back to a full fsync elsewhere
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# mkstemp creates files as 0600; widen them to what open() would have
+# created under the process umask (read once, since it can only be queried
+# by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_bytes(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _AppendHandle:
+    """Open append descriptor; fd is None once closed (checked under lock)."""
+    __slots__ = ("fd", "lock")
+
+    def __init__(self, fd: int):
+        self.fd = fd
+        self.lock = threading.Lock()
+
+    def close(self):
+        with self.lock:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+
 
 @dataclass
 class StorageConfig:
@@ -19,7 +84,7 @@ class StorageConfig:
     base_dir: str = "./output"
     organize_by_date: bool = True  # Create date-based subdirectories
     organize_by_type: bool = True  # Create type-based subdirectories
-    include_metadata: bool = True  # Store JSON metadata alongside markdown
+    include_metadata: bool = True  # Embed metadata as markdown frontmatter
     timestamp_format: str = "%Y-%m-%d_%H-%M-%S"
 
 
@@ -29,6 +94,24 @@ class FileStorage:
     Creates organized directory structures and handles file writing.
     """
 
+    # Async writes are drained in batches of up to WRITE_BATCH_SIZE files,
+    # waiting at most WRITE_BATCH_DELAY seconds for a batch to fill.
+    WRITE_BATCH_SIZE = 32
+    WRITE_BATCH_DELAY = 0.005
+
+    # Append-only log of saved files per content type, used by get_latest
+    INDEX_FILENAME = ".index"
+    INDEX_TAIL_BYTES = 4096
+
+    # Worker threads used to scan top-level subdirectories in list_files
+    LIST_WORKERS = 8
+
+    # Emit an info-level summary once every LOG_EVERY_SAVES saves
+    LOG_EVERY_SAVES = 100
+
+    # Append descriptors kept open at once; least recently used are closed
+    MAX_APPEND_FDS = 32
+
     def __init__(self, config: Optional[StorageConfig] = None):
         """
         Initialize file storage with configuration.
@@ -37,6 +120,17 @@ class FileStorage:
             config: Storage configuration (uses defaults if not provided)
         """
         self.config = config or StorageConfig()
+        self._base_str = os.fspath(self.config.base_dir)
+        self._created_dirs: Dict[tuple, str] = {}
+        self._day_str = ""
+        self._day_expires = 0.0
+        self._dirs_lock = threading.RLock()
+        self._listing_cache: Dict[tuple, tuple[list[tuple[str, int]], list[str]]] = {}
+        self._save_counter = itertools.count(1)
+        self._append_fds: "OrderedDict[str, _AppendHandle]" = OrderedDict()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
         self._ensure_base_dir()
 
     def _ensure_base_dir(self):
@@ -49,7 +143,7 @@ class FileStorage:
         filename: str,
         content_type: str,
         timestamp: Optional[datetime] = None
-    ) -> Path:
+    ) -> str:
         """
         Generate organized file path based on configuration.
 
@@ -61,22 +155,34 @@ class FileStorage:
         Returns:
             Full path for the file
         """
-        path_parts = [self.config.base_dir]
-
-        # Add type-based subdirectory
-        if self.config.organize_by_type:
-            path_parts.append(content_type)
-
-        # Add date-based subdirectory
+        # Type-based and date-based subdirectories
+        type_part = content_type if self.config.organize_by_type else None
+        date_part = None
         if self.config.organize_by_date:
-            ts = timestamp or datetime.now()
-            path_parts.append(ts.strftime("%Y-%m-%d"))
-
-        # Create full path
-        full_path = Path(*path_parts)
-        full_path.mkdir(parents=True, exist_ok=True)
-
-        return full_path / filename
+            date_part = timestamp.strftime("%Y-%m-%d") if timestamp else self._today()
+
+        # Build and create each directory only once
+        key = (type_part, date_part)
+        full_path = self._created_dirs.get(key)
+        if full_path is None:
+            with self._dirs_lock:
+                full_path = self._created_dirs.get(key)
+                if full_path is None:
+                    parts = [part for part in key if part is not None]
+                    full_path = os.path.join(self._base_str, *parts)
+                    os.makedirs(full_path, exist_ok=True)
+                    self._created_dirs[key] = full_path
+
+        return os.path.join(full_path, filename)
+
+    def _today(self) -> str:
+        """Current local date string, re-formatted only after local midnight."""
+        if time.time() >= self._day_expires:
+            now = datetime.now()
+            next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._day_str = now.strftime("%Y-%m-%d")
+            self._day_expires = next_midnight.timestamp()
+        return self._day_str
 
     def save_markdown(
         self,
@@ -108,57 +214,342 @@ class FileStorage:
             ...     metadata={"source": "podcast", "duration": 3600}
             ... )
         """
+        file_path, payload = self._prepare_markdown(
+            content, filename, content_type, metadata, timestamp
+        )
+
+        self._write_bytes(file_path, payload)
+        self._append_index(content_type, file_path)
+
+        self._listing_cache.clear()
+        self._log_saved(file_path)
+
+        return os.path.abspath(file_path)
+
+    async def save_markdown_async(
+        self,
+        content: str,
+        filename: str,
+        content_type: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> str:
+        """
+        Save content as markdown without blocking the event loop.
+
+        Writes are queued and flushed in batches on worker threads.
+        Arguments and return value match save_markdown.
+        """
+        file_path, payload = self._prepare_markdown(
+            content, filename, content_type, metadata, timestamp
+        )
+
+        future = asyncio.get_running_loop().create_future()
+        self._get_write_queue().put_nowait((file_path, payload, future))
+        await future
+        await asyncio.to_thread(self._append_index, content_type, file_path)
+
+        self._listing_cache.clear()
+        self._log_saved(file_path)
+
+        return os.path.abspath(file_path)
+
+    def append_markdown(
+        self,
+        content: str,
+        filename: str,
+        content_type: str,
+        timestamp: Optional[datetime] = None
+    ) -> str:
+        """
+        Append content to a markdown file, e.g. streamed transcript chunks.
+
+        Descriptors of the MAX_APPEND_FDS most recently appended files stay
+        open so each append is a single write; close() releases them.
+
+        Args:
+            content: Markdown content to append
+            filename: Filename (without extension)
+            content_type: Type of content for organization
+            timestamp: Optional timestamp for organization
+
+        Returns:
+            Absolute path to the appended file
+        """
         # Ensure .md extension
         if not filename.endswith(".md"):
             filename = f"{filename}.md"
 
         file_path = self._get_storage_path(filename, content_type, timestamp)
 
-        # Write markdown file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = memoryview(content.encode("utf-8"))
+        while True:
+            handle = self._append_handle(file_path, content_type)
+            with handle.lock:
+                # Evicted or closed since we looked it up: open it again
+                if handle.fd is None:
+                    continue
+                while data:
+                    data = data[os.write(handle.fd, data):]
+            break
+
+        return os.path.abspath(file_path)
+
+    def _append_handle(self, file_path: str, content_type: str) -> _AppendHandle:
+        """Get (or open) the append descriptor for a file, evicting the LRU one."""
+        evicted = []
+        with self._dirs_lock:
+            handle = self._append_fds.get(file_path)
+            if handle is not None:
+                self._append_fds.move_to_end(file_path)
+            else:
+                handle = _AppendHandle(self._open_recreating_dir(
+                    file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND
+                ))
+                self._append_fds[file_path] = handle
+                self._append_index(content_type, file_path)
+                self._listing_cache.clear()
+                while len(self._append_fds) > self.MAX_APPEND_FDS:
+                    evicted.append(self._append_fds.popitem(last=False)[1])
+
+        # Close outside the registry lock; each waits for in-flight writes
+        for old in evicted:
+            old.close()
+        return handle
+
+    async def aclose(self):
+        """
+        Flush pending async writes, stop the background writer and release
+        append file descriptors.
+        """
+        task, queue, loop = self._writer_task, self._write_queue, self._writer_loop
+        # Saves issued from here on start a fresh writer
+        self._writer_task = self._write_queue = self._writer_loop = None
+
+        if task is not None and loop is asyncio.get_running_loop():
+            # The drainer flushes everything queued before the sentinel
+            queue.put_nowait(None)
+            await task
+        elif task is not None:
+            task.cancel()
+        self.close()
+
+    def close(self):
+        """Close file descriptors held open by append_markdown."""
+        with self._dirs_lock:
+            handles, self._append_fds = self._append_fds, OrderedDict()
+        for handle in handles.values():
+            handle.close()
+
+    def _prepare_markdown(
+        self,
+        content: str,
+        filename: str,
+        content_type: str,
+        metadata: Optional[Dict[str, Any]],
+        timestamp: Optional[datetime]
+    ) -> tuple[str, bytes]:
+        """Resolve the target path and serialize the file payload for a save."""
+        # Ensure .md extension
+        if not filename.endswith(".md"):
+            filename = f"{filename}.md"
 
-        logger.info(f"Saved markdown file: {file_path}")
+        file_path = self._get_storage_path(filename, content_type, timestamp)
 
-        # Save metadata if requested
+        # Embed metadata as frontmatter if requested
         if metadata and self.config.include_metadata:
-            self._save_metadata(file_path, metadata, timestamp)
+            content = self._with_frontmatter(content, file_path, metadata, timestamp)
+
+        return file_path, content.encode("utf-8")
+
+    def _log_saved(self, file_path: str):
+        """Log a save at debug level, with a periodic info summary."""
+        saved = next(self._save_counter)
+        logger.debug("Saved markdown file: %s", file_path)
+        if saved % self.LOG_EVERY_SAVES == 0:
+            logger.info("Saved %d markdown files, latest=%s", saved, file_path)
+
+    def _index_path(self, content_type: str) -> str:
+        """Path of the append-only save index for a content type."""
+        return os.path.join(self.config.base_dir, content_type, self.INDEX_FILENAME)
+
+    def _append_index(self, content_type: str, file_path: str):
+        """Record a saved file in the content type's index."""
+        if not self.config.organize_by_type:
+            return
+        line = f"{time.time_ns()}\t{file_path}\n".encode("utf-8")
+        fd = os.open(self._index_path(content_type), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def _read_index_tail(self, content_type: str) -> Optional[str]:
+        """Return the last path recorded in the index, if any."""
+        try:
+            with open(self._index_path(content_type), "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - self.INDEX_TAIL_BYTES))
+                tail = f.read()
+        except FileNotFoundError:
+            return None
 
-        return str(file_path.absolute())
+        lines = tail.rstrip(b"\n").rsplit(b"\n", 1)
+        _, _, path = lines[-1].partition(b"\t")
+        return path.decode("utf-8") or None
+
+    def _get_write_queue(self) -> asyncio.Queue:
+        """Return the write queue for the running loop, starting its drainer."""
+        loop = asyncio.get_running_loop()
+        if self._writer_loop is not loop or self._writer_task is None or self._writer_task.done():
+            self._write_queue = asyncio.Queue()
+            self._writer_loop = loop
+            self._writer_task = loop.create_task(self._drain_writes(self._write_queue))
+        return self._write_queue
+
+    async def _drain_writes(self, queue: asyncio.Queue):
+        """Flush queued writes in batches on worker threads until a None sentinel."""
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.WRITE_BATCH_DELAY
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+
+            results = await asyncio.gather(
+                *[asyncio.to_thread(self._write_bytes, path, data) for path, data, _ in batch],
+                return_exceptions=True
+            )
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
+
+    def _recreate_dir(self, dir_path: str):
+        """Forget a cached directory that was removed underneath us and recreate it."""
+        with self._dirs_lock:
+            for key, cached in list(self._created_dirs.items()):
+                if cached == dir_path:
+                    del self._created_dirs[key]
+            os.makedirs(dir_path, exist_ok=True)
+        logger.warning("Recreated missing storage directory: %s", dir_path)
+
+    def _open_recreating_dir(self, path: str, flags: int) -> int:
+        """os.open that recreates the file's directory if it has been removed."""
+        try:
+            return os.open(path, flags, 0o666)
+        except FileNotFoundError:
+            self._recreate_dir(os.path.dirname(path))
+            return os.open(path, flags, 0o666)
+
+    def _write_bytes(self, path: str, data: bytes):
+        """
+        Atomically write a pre-serialized payload.
 
-    def _save_metadata(
+        Data goes to a temp file in the same directory, is flushed with
+        fdatasync and then renamed over the target, so readers never see
+        a partially written file.
+        """
+        dir_path = os.path.dirname(path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".tmp_")
+        except FileNotFoundError:
+            self._recreate_dir(dir_path)
+            fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".tmp_")
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                os.fchmod(fd, _FILE_MODE)
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _with_frontmatter(
         self,
-        markdown_path: Path,
+        content: str,
+        markdown_path: str,
         metadata: Dict[str, Any],
         timestamp: Optional[datetime] = None
-    ):
+    ) -> str:
         """
-        Save metadata as JSON file alongside markdown.
+        Embed metadata in the document's frontmatter.
+
+        The metadata is JSON-encoded on a single _METADATA_FIELD line so
+        load_markdown can restore its types. If the content starts with a
+        frontmatter block of YAML key/value entries, the line is appended to
+        it; otherwise (no block, or a leading horizontal rule) a separate
+        block is prepended. The document's own lines are never changed.
 
         Args:
+            content: Markdown content to save
             markdown_path: Path to the markdown file
             metadata: Metadata to save
             timestamp: Optional timestamp
-        """
-        # Create metadata file path (same name, .json extension)
-        metadata_path = markdown_path.with_suffix(".json")
 
+        Returns:
+            Content with metadata frontmatter
+        """
         # Add automatic metadata
         full_metadata = {
             "created_at": (timestamp or datetime.now()).isoformat(),
-            "markdown_file": markdown_path.name,
+            "markdown_file": os.path.basename(markdown_path),
             **metadata
         }
-
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(full_metadata, f, indent=2)
-
-        logger.info(f"Saved metadata file: {metadata_path}")
+        line = f"{_METADATA_FIELD}: {_dump_json_bytes(full_metadata).decode('utf-8')}\n"
+
+        match = _FRONTMATTER_RE.match(content)
+        if match and self._is_key_value_block(match.group(1)):
+            return f"---\n{match.group(1)}{line}---\n{content[match.end():]}"
+        return f"---\n{line}---\n\n{content}"
+
+    @staticmethod
+    def _is_key_value_block(block: str) -> bool:
+        """Check that a frontmatter block holds only YAML key/value entries."""
+        lines = block.splitlines()
+        if not lines or not _YAML_KEY_RE.match(lines[0]):
+            return False
+        for line in lines:
+            if line.startswith(f"{_METADATA_FIELD}:"):
+                return False
+            if not (_YAML_KEY_RE.match(line) or _YAML_CONTINUATION_RE.match(line)
+                    or not line.strip()):
+                return False
+        return True
 
     def load_markdown(self, file_path: str) -> tuple[str, Optional[Dict[str, Any]]]:
         """
         Load markdown file and its metadata if available.
 
+        Metadata comes from the frontmatter block, falling back to a
+        .json sidecar for files saved by older versions.
+
         Args:
             file_path: Path to markdown file
 
@@ -171,18 +562,54 @@ class FileStorage:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Read markdown content
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = path.read_bytes().decode("utf-8")
 
-        # Try to load metadata
+        parsed = self._split_frontmatter(content)
+        if parsed is not None:
+            return parsed
+
+        # Legacy sidecar metadata
         metadata = None
-        metadata_path = path.with_suffix(".json")
-        if metadata_path.exists():
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+        json_path = path.with_suffix(".json")
+        if json_path.exists():
+            metadata = _load_json_bytes(json_path.read_bytes())
 
         return content, metadata
 
+    @staticmethod
+    def _split_frontmatter(content: str) -> Optional[tuple[str, Dict[str, Any]]]:
+        """
+        Separate metadata written by _with_frontmatter from the document.
+
+        Only the _METADATA_FIELD line of the leading block is removed; the
+        document's own frontmatter stays in the returned content, and a block
+        that held nothing else is dropped. Returns None if the content has no
+        such line.
+        """
+        match = _FRONTMATTER_RE.match(content)
+        if not match:
+            return None
+
+        lines = match.group(1).splitlines(keepends=True)
+        for index, line in enumerate(lines):
+            key, sep, value = line.rstrip("\n").partition(": ")
+            if not (sep and key == _METADATA_FIELD):
+                continue
+            try:
+                metadata = json.loads(value)
+            except ValueError:
+                return None
+            if not isinstance(metadata, dict):
+                return None
+
+            kept = lines[:index] + lines[index + 1:]
+            body = content[match.end():]
+            if kept:
+                return f"---\n{''.join(kept)}---\n{body}", metadata
+            return (body[1:] if body.startswith("\n") else body), metadata
+
+        return None
+
     def list_files(
         self,
         content_type: Optional[str] = None,
@@ -198,19 +625,76 @@ class FileStorage:
         Returns:
             List of file paths
         """
-        base_path = Path(self.config.base_dir)
+        base_path = self._base_str
 
         if content_type:
-            base_path = base_path / content_type
+            base_path = os.path.join(base_path, content_type)
 
         if date and self.config.organize_by_date:
-            base_path = base_path / date
-
-        if not base_path.exists():
+            base_path = os.path.join(base_path, date)
+
+        # Reuse the previous walk unless we saved since or any directory in
+        # it changed (adding a file only touches its own directory's mtime)
+        key = (content_type, date)
+        cached = self._listing_cache.get(key)
+        if cached and self._dirs_unchanged(cached[0]):
+            return list(cached[1])
+
+        try:
+            top_mtime = os.stat(base_path).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        # Find all markdown files
-        return [str(p) for p in base_path.rglob("*.md")]
+        # Find all markdown files, scanning top-level subdirectories in parallel
+        files = []
+        dirs = [(base_path, top_mtime)]
+        subdirs = []
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    files.append(entry.path)
+
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.LIST_WORKERS, len(subdirs))) as executor:
+                for subtree_files, subtree_dirs in executor.map(self._scan_markdown, subdirs):
+                    files.extend(subtree_files)
+                    dirs.extend(subtree_dirs)
+        elif subdirs:
+            subtree_files, subtree_dirs = self._scan_markdown(subdirs[0])
+            files.extend(subtree_files)
+            dirs.extend(subtree_dirs)
+
+        self._listing_cache[key] = (dirs, files)
+        return list(files)
+
+    @staticmethod
+    def _dirs_unchanged(dirs: list[tuple[str, int]]) -> bool:
+        """Check every directory of a cached walk still has its recorded mtime."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in dirs)
+        except FileNotFoundError:
+            return False
+
+    @classmethod
+    def _scan_markdown(cls, path: str) -> tuple[list[str], list[tuple[str, int]]]:
+        """
+        Recursively collect markdown file paths under path, along with the
+        (path, mtime_ns) of every directory visited.
+        """
+        # Stat before listing so a file added mid-scan invalidates the cache
+        files = []
+        dirs = [(path, os.stat(path).st_mtime_ns)]
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subtree_files, subtree_dirs = cls._scan_markdown(entry.path)
+                    files.extend(subtree_files)
+                    dirs.extend(subtree_dirs)
+                elif entry.name.endswith(".md"):
+                    files.append(entry.path)
+        return files, dirs
 
     def get_latest(self, content_type: str) -> Optional[str]:
         """
@@ -222,95 +706,127 @@ class FileStorage:
         Returns:
             Path to latest file, or None if no files found
         """
-        files = self.list_files(content_type)
+        latest = self._read_index_tail(content_type)
+        if latest and os.path.exists(latest):
+            return latest
 
-        if not files:
+        base_path = os.path.join(self.config.base_dir, content_type)
+        if not os.path.isdir(base_path):
             return None
 
-        # Sort by modification time
-        latest = max(files, key=lambda f: os.path.getmtime(f))
+        # Index missing or stale: single scandir walk, then reseed the index
+        mtime, latest = max(self._walk_markdown(base_path), default=(0, None))
+        if latest:
+            self._append_index(content_type, latest)
         return latest
 
+    @classmethod
+    def _walk_markdown(cls, path: str):
+        """Yield (mtime, path) for every markdown file under path."""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from cls._walk_markdown(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry.stat().st_mtime, entry.path
+
+
+@functools.lru_cache(maxsize=256)
+def _frontmatter_formatter(keys: tuple):
+    """
+    Generate a frontmatter formatter specialized for one metadata key order.
+
+    Strings are emitted as-is and everything else as JSON, matching the
+    generic loop, but without iterating or building a line list per call.
+    """
+    parts = ['"---\\n"']
+    for i, key in enumerate(keys):
+        parts.append(repr(f"{key}: "))
+        parts.append(f"(v{i} if isinstance(v{i}, str) else dumps(v{i}))")
+        parts.append('"\\n"')
+    parts.append('"---\\n"')
+
+    source = "def _fmt(m):\n"
+    for i in range(len(keys)):
+        source += f"    v{i} = m[keys[{i}]]\n"
+    source += f"    return ''.join(({', '.join(parts)},))\n"
+
+    namespace = {"keys": keys, "dumps": json.dumps}
+    exec(source, namespace)
+    return namespace["_fmt"]
+
 
 class MarkdownBuilder:
     """
     Helper class for building well-formatted markdown documents.
+    Sections are kept as UTF-8 bytes and joined once at build time.
     """
 
     def __init__(self):
-        self.sections = []
+        self.sections: list[bytes] = []
 
     def add_frontmatter(self, metadata: Dict[str, Any]) -> "MarkdownBuilder":
         """Add YAML frontmatter to the document."""
-        lines = ["---"]
-        for key, value in metadata.items():
-            if isinstance(value, str):
-                lines.append(f"{key}: {value}")
-            else:
-                lines.append(f"{key}: {json.dumps(value)}")
-        lines.append("---")
-        lines.append("")  # Blank line after frontmatter
-
-        self.sections.insert(0, "\n".join(lines))
+        frontmatter = _frontmatter_formatter(tuple(metadata))(metadata)
+        self.sections.insert(0, frontmatter.encode("utf-8"))
         return self
 
     def add_heading(self, text: str, level: int = 1) -> "MarkdownBuilder":
         """Add a heading."""
-        self.sections.append(f"{'#' * level} {text}\n")
+        self.sections.append(f"{'#' * level} {text}\n".encode("utf-8"))
         return self
 
     def add_paragraph(self, text: str) -> "MarkdownBuilder":
         """Add a paragraph."""
-        self.sections.append(f"{text}\n")
+        self.sections.append(f"{text}\n".encode("utf-8"))
         return self
 
     def add_list(self, items: list[str], ordered: bool = False) -> "MarkdownBuilder":
         """Add a list (bulleted or numbered)."""
-        lines = []
-        for i, item in enumerate(items, 1):
-            prefix = f"{i}." if ordered else "-"
-            lines.append(f"{prefix} {item}")
-        self.sections.append("\n".join(lines) + "\n")
+        if ordered:
+            lines = [f"{i}. {item}" for i, item in enumerate(items, 1)]
+        else:
+            lines = [f"- {item}" for item in items]
+        self.sections.append(("\n".join(lines) + "\n").encode("utf-8"))
         return self
 
     def add_code_block(self, code: str, language: str = "") -> "MarkdownBuilder":
         """Add a code block."""
-        self.sections.append(f"```{language}\n{code}\n```\n")
+        self.sections.append(f"```{language}\n{code}\n```\n".encode("utf-8"))
         return self
 
     def add_quote(self, text: str) -> "MarkdownBuilder":
         """Add a blockquote."""
-        lines = [f"> {line}" for line in text.split("\n")]
-        self.sections.append("\n".join(lines) + "\n")
+        self.sections.append(("> " + text.replace("\n", "\n> ") + "\n").encode("utf-8"))
         return self
 
     def add_horizontal_rule(self) -> "MarkdownBuilder":
         """Add a horizontal rule."""
-        self.sections.append("---\n")
+        self.sections.append(b"---\n")
         return self
 
     def add_table(self, headers: list[str], rows: list[list[str]]) -> "MarkdownBuilder":
         """Add a table."""
-        lines = []
-
-        # Header row
-        lines.append("| " + " | ".join(headers) + " |")
+        sep = " | "
 
-        # Separator
-        lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+        # Header row and separator
+        header = f"| {sep.join(headers)} |\n| {sep.join(['---'] * len(headers))} |\n"
 
-        # Data rows
-        for row in rows:
-            lines.append("| " + " | ".join(row) + " |")
+        # Data rows, rendered in a single join
+        body = "".join([f"| {sep.join(row)} |\n" for row in rows])
 
-        self.sections.append("\n".join(lines) + "\n")
+        self.sections.append((header + body).encode("utf-8"))
         return self
 
     def add_custom(self, markdown: str) -> "MarkdownBuilder":
         """Add custom markdown content."""
-        self.sections.append(markdown + "\n")
+        self.sections.append((markdown + "\n").encode("utf-8"))
         return self
 
+    def build_bytes(self) -> bytes:
+        """Build the final markdown document as UTF-8 bytes."""
+        return b"\n".join(self.sections)
+
     def build(self) -> str:
         """Build the final markdown document."""
-        return "\n".join(self.sections)
+        return self.build_bytes().decode("utf-8")
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session instead of one per test"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
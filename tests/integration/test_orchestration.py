@@ -6,20 +6,35 @@ Tests complete workflows from task submission to completion
 import pytest
 import asyncio
 import time
-from unittest.mock import Mock, patch
+import orjson
+from unittest.mock import Mock, MagicMock, patch
 from core.orchestrator import Orchestrator, TaskDefinition
 from core.execution_engine import ExecutionMode
 from state.redis_manager import RedisStateManager, AgentInfo
 
 
+# Shared fields for concurrently submitted tasks; per-task fields are merged in
+_CONCURRENT_TASK_TEMPLATE = {
+    "task_type": "data_analysis",
+    "execution_mode": ExecutionMode.PARALLEL,
+    "priority": 5,
+    "timeout_ms": 10000,
+}
+
+
 @pytest.fixture
 def mock_redis():
     """Mock Redis for integration tests"""
     with patch('state.redis_manager.redis.Redis') as mock:
-        redis_client = Mock()
+        redis_client = MagicMock()
         mock.return_value = redis_client
         redis_client.ping.return_value = True
-        redis_client.pipeline.return_value.__enter__.return_value.execute.return_value = [True, 1]
+        # Pipelines are used both directly and as context managers
+        pipe = redis_client.pipeline.return_value
+        pipe.__enter__.return_value = pipe
+        pipe.execute.return_value = [True, 1]
+        # Server-side scripts report success (e.g. the task exists)
+        redis_client.register_script.return_value.return_value = 1
         redis_client.get.return_value = None
         redis_client.smembers.return_value = set()
         redis_client.zcard.return_value = 0
@@ -27,6 +42,22 @@ def mock_redis():
         yield redis_client
 
 
+def _mock_stored_task(mock_redis, task_def, status="queued"):
+    """Make the mocked pipeline read back a task as create_task stores it"""
+    now = time.time()
+    mock_redis.pipeline.return_value.execute.return_value = [
+        orjson.dumps({
+            "task_id": task_def.task_id,
+            "task_type": task_def.task_type,
+            "created_at": now,
+            "metadata": task_def.metadata,
+            "priority": task_def.priority
+        }),
+        {"status": status, "updated_at": repr(now), "retry_count": "0"},
+        []
+    ]
+
+
 @pytest.fixture
 async def orchestrator(mock_redis):
     """Create orchestrator instance"""
@@ -92,6 +123,7 @@ class TestReportGenerationWorkflow:
         # Submit task
         submit_response = await orchestrator.submit_task(task_def)
         assert submit_response["status"] == "queued"
+        _mock_stored_task(mock_redis, task_def)
 
         # Wait for processing
         await asyncio.sleep(0.5)
@@ -160,7 +192,7 @@ class TestTaskManagement:
     """Test task lifecycle management"""
 
     @pytest.mark.asyncio
-    async def test_get_task_status(self, orchestrator):
+    async def test_get_task_status(self, orchestrator, mock_redis):
         """Test retrieving task status"""
         task_def = TaskDefinition(
             task_id="status-test-001",
@@ -173,13 +205,14 @@ class TestTaskManagement:
         )
 
         await orchestrator.submit_task(task_def)
+        _mock_stored_task(mock_redis, task_def)
 
         status = await orchestrator.get_task_status("status-test-001")
         assert status is not None
         assert status["task_id"] == "status-test-001"
 
     @pytest.mark.asyncio
-    async def test_cancel_task(self, orchestrator):
+    async def test_cancel_task(self, orchestrator, mock_redis):
         """Test cancelling a task"""
         task_def = TaskDefinition(
             task_id="cancel-test-001",
@@ -192,6 +225,7 @@ class TestTaskManagement:
         )
 
         await orchestrator.submit_task(task_def)
+        _mock_stored_task(mock_redis, task_def)
 
         # Cancel task
         result = await orchestrator.cancel_task("cancel-test-001", "User requested")
@@ -200,26 +234,23 @@ class TestTaskManagement:
     @pytest.mark.asyncio
     async def test_concurrent_task_submissions(self, orchestrator):
         """Test handling multiple concurrent task submissions"""
-        tasks = []
-
-        for i in range(10):
-            task_def = TaskDefinition(
-                task_id=f"concurrent-{i}",
-                task_type="data_analysis",
-                inputs=[{"input_id": f"input-{i}", "type": "json", "data": {}}],
-                execution_mode=ExecutionMode.PARALLEL,
-                priority=5,
-                timeout_ms=10000,
-                metadata={}
-            )
-            tasks.append(orchestrator.submit_task(task_def))
+        tasks = [
+            orchestrator.submit_task(TaskDefinition(**(_CONCURRENT_TASK_TEMPLATE | {
+                "task_id": f"concurrent-{i}",
+                "inputs": [{"input_id": f"input-{i}", "type": "json", "data": {}}],
+                "metadata": {}
+            })))
+            for i in range(10)
+        ]
 
         # Submit all tasks concurrently
         responses = await asyncio.gather(*tasks)
 
-        # All should be queued
+        # All should be queued, each under its own id, without touching the template
         assert all(r["status"] == "queued" for r in responses)
         assert len(responses) == 10
+        assert {r["task_id"] for r in responses} == {f"concurrent-{i}" for i in range(10)}
+        assert "task_id" not in _CONCURRENT_TASK_TEMPLATE
 
 
 class TestFaultTolerance:
@@ -3,13 +3,39 @@ Stress tests for orchestrator using Locust
 Simulates 1000+ concurrent tasks with various failure scenarios
 """
 
+import os
 import time
 import random
-import json
+import itertools
+import orjson
 from locust import HttpUser, task, between, events
 from locust.runners import MasterRunner, WorkerRunner
 
 
+def _random_payload():
+    """Generate random data for testing"""
+    data_types = [
+        {"text": f"Sample text data {random.randint(1, 10000)}"},
+        {"numbers": [random.random() for _ in range(10)]},
+        {"structured": {"key1": "value1", "key2": random.randint(1, 100)}}
+    ]
+    return random.choice(data_types)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Distinguishes task ids generated by different locust worker processes
+_PID = os.getpid()
+
+# Shared by every user in this process so ids never collide between users;
+# seeded from the process start time (ms, shifted past the per-run count) so
+# ids don't repeat across runs or containers that share a PID
+_ID_COUNTER = itertools.count(int(time.time() * 1000) << 20)
+
+# Built once so RNG and dict allocation stay out of the measured request path
+_PAYLOAD_POOL = [_random_payload() for _ in range(256)]
+
+
 class OrchestratorStressTest(HttpUser):
     """
     Stress test user simulating task submissions
@@ -18,7 +44,6 @@ class OrchestratorStressTest(HttpUser):
 
     def on_start(self):
         """Initialize user session"""
-        self.task_counter = 0
         self.submitted_tasks = []
 
     @task(5)
@@ -27,8 +52,7 @@ class OrchestratorStressTest(HttpUser):
         Submit report generation task (Use Case 1)
         Weight: 5 (50% of requests)
         """
-        task_id = f"report-{self.task_counter}-{int(time.time()*1000)}"
-        self.task_counter += 1
+        task_id = f"report-{_PID}-{next(_ID_COUNTER)}"
 
         payload = {
             "task_id": task_id,
@@ -52,7 +76,8 @@ class OrchestratorStressTest(HttpUser):
 
         with self.client.post(
             "/api/v1/tasks",
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
             catch_response=True,
             name="Submit Report Task"
         ) as response:
@@ -72,8 +97,7 @@ class OrchestratorStressTest(HttpUser):
         Submit real-time monitoring task (Use Case 2)
         Weight: 3 (30% of requests)
         """
-        task_id = f"monitor-{self.task_counter}-{int(time.time()*1000)}"
-        self.task_counter += 1
+        task_id = f"monitor-{_PID}-{next(_ID_COUNTER)}"
 
         payload = {
             "task_id": task_id,
@@ -96,7 +120,8 @@ class OrchestratorStressTest(HttpUser):
 
         with self.client.post(
             "/api/v1/tasks",
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
             catch_response=True,
             name="Submit Monitoring Task"
         ) as response:
@@ -146,8 +171,7 @@ class OrchestratorStressTest(HttpUser):
         Submit API call task
         Weight: 1 (10% of requests)
         """
-        task_id = f"api-{self.task_counter}-{int(time.time()*1000)}"
-        self.task_counter += 1
+        task_id = f"api-{_PID}-{next(_ID_COUNTER)}"
 
         payload = {
             "task_id": task_id,
@@ -170,7 +194,8 @@ class OrchestratorStressTest(HttpUser):
 
         with self.client.post(
             "/api/v1/tasks",
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
             catch_response=True,
             name="Submit API Task"
         ) as response:
@@ -179,13 +204,19 @@ class OrchestratorStressTest(HttpUser):
                 response.success()
 
     def _generate_random_data(self):
-        """Generate random data for testing"""
-        data_types = [
-            {"text": f"Sample text data {random.randint(1, 10000)}"},
-            {"numbers": [random.random() for _ in range(10)]},
-            {"structured": {"key1": "value1", "key2": random.randint(1, 100)}}
-        ]
-        return random.choice(data_types)
+        """Pick random data for testing from the precomputed pool"""
+        return random.choice(_PAYLOAD_POOL)
+
+
+# Constant part of the failing task payload, without the closing brace
+_FAILING_TASK_PREFIX = orjson.dumps({
+    "task_type": "unknown_type",  # This should fail
+    "inputs": [],
+    "execution_mode": "parallel",
+    "priority": 5,
+    "timeout_ms": 1000,
+    "metadata": {}
+})[:-1]
 
 
 class FailureScenarioTest(HttpUser):
@@ -197,21 +228,15 @@ class FailureScenarioTest(HttpUser):
     @task
     def submit_failing_task(self):
         """Submit tasks designed to fail"""
-        task_id = f"fail-{int(time.time()*1000)}"
+        task_id = f"fail-{_PID}-{next(_ID_COUNTER)}"
 
-        payload = {
-            "task_id": task_id,
-            "task_type": "unknown_type",  # This should fail
-            "inputs": [],
-            "execution_mode": "parallel",
-            "priority": 5,
-            "timeout_ms": 1000,
-            "metadata": {}
-        }
+        # Splice the task_id into the pre-encoded constant fields
+        payload = _FAILING_TASK_PREFIX + b',"task_id":"' + task_id.encode() + b'"}'
 
         with self.client.post(
             "/api/v1/tasks",
-            json=payload,
+            data=payload,
+            headers=JSON_HEADERS,
             catch_response=True,
             name="Submit Failing Task"
         ) as response:
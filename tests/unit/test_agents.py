@@ -13,54 +13,92 @@ from agents.alerting_agent import AlertingAgent
 from agents.api_caller_agent import APICallerAgent
 
 
-class TestDataIngestAgent:
-    """Test suite for Data Ingest Agent"""
+# Stateless agents are shared across a module; stateful ones (alert cache,
+# circuit breakers) are rebuilt per test.
 
-    @pytest.mark.asyncio
-    async def test_process_text_input(self):
-        """Test text input processing"""
-        agent = DataIngestAgent(agent_id="test-ingest-1")
+@pytest.fixture(scope="module")
+def ingest_agent():
+    return DataIngestAgent(agent_id="test-ingest")
+
+
+@pytest.fixture(scope="module")
+def analysis_agent():
+    return DataAnalysisAgent(agent_id="test-analysis")
+
+
+@pytest.fixture(scope="module")
+def synthesis_agent():
+    return SynthesisAgent(agent_id="test-synthesis")
+
+
+@pytest.fixture(scope="module")
+def video_agent():
+    return VideoDetectionAgent(agent_id="test-video")
+
+
+@pytest.fixture
+def alerting_agent():
+    return AlertingAgent(agent_id="test-alert")
+
+
+@pytest.fixture
+def api_agent():
+    return APICallerAgent(agent_id="test-api")
+
+
+FAKE_VIDEO_DATA = b"fake_video_data"
+
+CROWD_OBJECTS = [
+    {"class": "person", "confidence": confidence}
+    for confidence in (0.95, 0.92, 0.88, 0.85, 0.91, 0.94)
+]
 
-        inputs = [
+VEHICLE_OBJECTS = [{"class": "vehicle", "confidence": 0.9}]
+
+
+@pytest.fixture(scope="module")
+def make_input():
+    """Build a single-element AgentInput list"""
+    def _make_input(input_type, data, metadata=None, input_id="input-1"):
+        return [
             AgentInput(
-                input_id="input-1",
-                input_type="text",
-                data="Sample text for processing",
-                metadata={}
+                input_id=input_id,
+                input_type=input_type,
+                data=data,
+                metadata=metadata or {}
             )
         ]
+    return _make_input
+
+
+class TestDataIngestAgent:
+    """Test suite for Data Ingest Agent"""
+
+    @pytest.mark.asyncio
+    async def test_process_text_input(self, ingest_agent, make_input):
+        """Test text input processing"""
+        inputs = make_input("text", "Sample text for processing")
 
-        output = await agent.process(inputs, {})
+        output = await ingest_agent.process(inputs, {})
 
         assert output.output_type == "ingested_data"
         assert output.data["count"] == 1
         assert "text" in output.data["types"]
 
     @pytest.mark.asyncio
-    async def test_process_json_input(self):
+    async def test_process_json_input(self, ingest_agent, make_input):
         """Test JSON input processing"""
-        agent = DataIngestAgent(agent_id="test-ingest-2")
-
-        inputs = [
-            AgentInput(
-                input_id="input-1",
-                input_type="json",
-                data='{"key": "value", "number": 42}',
-                metadata={}
-            )
-        ]
+        inputs = make_input("json", '{"key": "value", "number": 42}')
 
-        output = await agent.process(inputs, {})
+        output = await ingest_agent.process(inputs, {})
 
         assert output.output_type == "ingested_data"
         assert len(output.data["records"]) == 1
 
     @pytest.mark.asyncio
-    async def test_health_check(self):
+    async def test_health_check(self, ingest_agent):
         """Test agent health check"""
-        agent = DataIngestAgent(agent_id="test-ingest-3")
-
-        health = agent.get_health()
+        health = ingest_agent.get_health()
 
         assert health["healthy"] is True
         assert health["agent_type"] == "data_ingest"
@@ -71,20 +109,11 @@ class TestDataAnalysisAgent:
     """Test suite for Data Analysis Agent"""
 
     @pytest.mark.asyncio
-    async def test_analysis_with_data(self):
+    async def test_analysis_with_data(self, analysis_agent, make_input):
         """Test data analysis"""
-        agent = DataAnalysisAgent(agent_id="test-analysis-1")
+        inputs = make_input("json", {"value": 42, "metric": 100})
 
-        inputs = [
-            AgentInput(
-                input_id="input-1",
-                input_type="json",
-                data={"value": 42, "metric": 100},
-                metadata={}
-            )
-        ]
-
-        output = await agent.process(inputs, {})
+        output = await analysis_agent.process(inputs, {})
 
         assert output.output_type == "analysis_result"
         assert "summary_statistics" in output.data
@@ -92,10 +121,8 @@ class TestDataAnalysisAgent:
         assert "anomalies" in output.data
 
     @pytest.mark.asyncio
-    async def test_statistics_computation(self):
+    async def test_statistics_computation(self, analysis_agent):
         """Test statistical computation"""
-        agent = DataAnalysisAgent(agent_id="test-analysis-2")
-
         # Create data with numeric values
         data_records = [
             {"value": 10},
@@ -105,7 +132,7 @@ class TestDataAnalysisAgent:
             {"value": 50}
         ]
 
-        stats = await agent._compute_statistics(data_records)
+        stats = await analysis_agent._compute_statistics(data_records)
 
         assert stats["count"] > 0
         assert "mean" in stats
@@ -116,10 +143,8 @@ class TestSynthesisAgent:
     """Test suite for Synthesis Agent"""
 
     @pytest.mark.asyncio
-    async def test_report_generation(self):
+    async def test_report_generation(self, synthesis_agent, make_input):
         """Test report generation from analysis"""
-        agent = SynthesisAgent(agent_id="test-synthesis-1")
-
         analysis_data = {
             "summary_statistics": {"count": 100, "mean": 50.0},
             "insights": ["Pattern detected"],
@@ -127,16 +152,9 @@ class TestSynthesisAgent:
             "trends": ["Increasing"]
         }
 
-        inputs = [
-            AgentInput(
-                input_id="input-1",
-                input_type="analysis_result",
-                data=analysis_data,
-                metadata={}
-            )
-        ]
+        inputs = make_input("analysis_result", analysis_data)
 
-        output = await agent.process(inputs, {})
+        output = await synthesis_agent.process(inputs, {})
 
         assert output.output_type == "json_report"
         assert "report_id" in output.data
@@ -149,53 +167,41 @@ class TestVideoDetectionAgent:
     """Test suite for Video Detection Agent"""
 
     @pytest.mark.asyncio
-    async def test_video_processing(self):
+    async def test_video_processing(self, video_agent, make_input):
         """Test video detection"""
-        agent = VideoDetectionAgent(agent_id="test-video-1")
-
-        inputs = [
-            AgentInput(
-                input_id="frame-1",
-                input_type="video",
-                data=b"fake_video_data",
-                metadata={"fps": 30, "resolution": "1920x1080"}
-            )
-        ]
+        inputs = make_input(
+            "video",
+            FAKE_VIDEO_DATA,
+            {"fps": 30, "resolution": "1920x1080"},
+            input_id="frame-1"
+        )
 
-        output = await agent.process(inputs, {})
+        output = await video_agent.process(inputs, {})
 
         assert output.output_type == "detections"
         assert "detections" in output.data
         assert output.data["detection_count"] > 0
 
     @pytest.mark.asyncio
-    async def test_event_detection(self):
+    @pytest.mark.parametrize("objects,parameters,expected_events", [
+        (CROWD_OBJECTS, {"max_persons": 5}, ["crowd_detected"]),
+        (CROWD_OBJECTS, {"max_persons": 10}, []),
+        (VEHICLE_OBJECTS, {"restricted_area": True}, ["unauthorized_vehicle"]),
+        (VEHICLE_OBJECTS, {}, []),
+    ])
+    async def test_event_detection(self, video_agent, objects, parameters, expected_events):
         """Test event detection from objects"""
-        agent = VideoDetectionAgent(agent_id="test-video-2")
-
-        objects = [
-            {"class": "person", "confidence": 0.95},
-            {"class": "person", "confidence": 0.92},
-            {"class": "person", "confidence": 0.88},
-            {"class": "person", "confidence": 0.85},
-            {"class": "person", "confidence": 0.91},
-            {"class": "person", "confidence": 0.94},
-        ]
+        events = await video_agent._detect_events(objects, parameters)
 
-        events = await agent._detect_events(objects, {"max_persons": 5})
-
-        assert len(events) > 0
-        assert events[0]["event_type"] == "crowd_detected"
+        assert [event["event_type"] for event in events] == expected_events
 
 
 class TestAlertingAgent:
     """Test suite for Alerting Agent"""
 
     @pytest.mark.asyncio
-    async def test_alert_generation(self):
+    async def test_alert_generation(self, alerting_agent, make_input):
         """Test alert generation"""
-        agent = AlertingAgent(agent_id="test-alert-1")
-
         detections_data = {
             "detections": [
                 {
@@ -212,26 +218,17 @@ class TestAlertingAgent:
             ]
         }
 
-        inputs = [
-            AgentInput(
-                input_id="input-1",
-                input_type="detections",
-                data=detections_data,
-                metadata={}
-            )
-        ]
+        inputs = make_input("detections", detections_data)
 
-        output = await agent.process(inputs, {})
+        output = await alerting_agent.process(inputs, {})
 
         assert output.output_type == "alerts"
         assert output.data["alert_count"] > 0
         assert len(output.data["alerts"]) > 0
 
     @pytest.mark.asyncio
-    async def test_alert_deduplication(self):
+    async def test_alert_deduplication(self, alerting_agent):
         """Test alert deduplication"""
-        agent = AlertingAgent(agent_id="test-alert-2")
-
         # Create duplicate alerts
         alerts = [
             {
@@ -250,7 +247,7 @@ class TestAlertingAgent:
             }
         ]
 
-        unique = agent._deduplicate_alerts(alerts)
+        unique = alerting_agent._deduplicate_alerts(alerts)
 
         # Only first alert should remain
         assert len(unique) == 1
@@ -260,42 +257,59 @@ class TestAPICallerAgent:
     """Test suite for API Caller Agent"""
 
     @pytest.mark.asyncio
-    async def test_api_call_success(self):
+    async def test_api_call_success(self, api_agent, make_input):
         """Test successful API call"""
-        agent = APICallerAgent(agent_id="test-api-1")
-
-        inputs = [
-            AgentInput(
-                input_id="input-1",
-                input_type="json",
-                data={"key": "value"},
-                metadata={"endpoint": "http://api.example.com/test"}
-            )
-        ]
+        inputs = make_input("json", {"key": "value"}, {"endpoint": "http://api.example.com/test"})
 
         parameters = {
             "endpoint": "http://api.example.com/test",
             "method": "POST"
         }
 
-        output = await agent.process(inputs, parameters)
+        output = await api_agent.process(inputs, parameters)
 
         assert output.output_type == "api_response"
         assert "responses" in output.data
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker(self):
+    async def test_circuit_breaker(self, api_agent):
         """Test circuit breaker functionality"""
-        agent = APICallerAgent(agent_id="test-api-2")
-
         endpoint = "http://failing-api.example.com"
 
         # Record failures to open circuit
         for _ in range(5):
-            agent._record_failure(endpoint)
+            api_agent._record_failure(endpoint)
 
         # Circuit should be open
-        assert agent._is_circuit_open(endpoint) is True
+        assert api_agent._is_circuit_open(endpoint) is True
+
+
+@pytest.mark.benchmark
+class TestAgentBenchmarks:
+    """Regression benchmarks for hot agent helpers (pytest-benchmark, run with -m benchmark)"""
+
+    def test_bench_deduplicate_alerts(self, benchmark, alerting_agent):
+        """Benchmark deduplicating 10k alerts over 1k distinct ids"""
+        alerts = [{"alert_id": f"a{i % 1000}", "severity": "low"} for i in range(10_000)]
+
+        def setup():
+            alerting_agent.alert_cache.clear()
+            return (alerts,), {}
+
+        unique = benchmark.pedantic(alerting_agent._deduplicate_alerts, setup=setup, rounds=20)
+
+        assert len(unique) == 1000
+
+    def test_bench_compute_statistics(self, benchmark, analysis_agent, event_loop, monkeypatch):
+        """Benchmark statistics over 10k records, without the simulated delay"""
+        monkeypatch.setattr(analysis_agent, "STATISTICS_DELAY_SECONDS", 0)
+        records = [{"value": i} for i in range(10_000)]
+
+        stats = benchmark(lambda: event_loop.run_until_complete(
+            analysis_agent._compute_statistics(records)
+        ))
+
+        assert stats["count"] == 10_000
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+"""
+Unit tests for File Storage
+"""
+
+import os
+import shutil
+import asyncio
+import pytest
+from datetime import datetime
+from storage.file_storage import FileStorage, StorageConfig, MarkdownBuilder
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """File storage rooted in a temporary directory"""
+    storage = FileStorage(StorageConfig(base_dir=str(tmp_path)))
+    yield storage
+    storage.close()
+
+
+class TestFileStorage:
+    """Test suite for File Storage"""
+
+    def test_save_and_load_with_metadata(self, storage):
+        """Test metadata round-trips through frontmatter with its types"""
+        path = storage.save_markdown(
+            "# Summary\nBody text",
+            "episode_001",
+            "summary",
+            metadata={"duration": 3600, "tags": ["ai"], "year": "2024", "flag": "true"}
+        )
+
+        content, metadata = storage.load_markdown(path)
+
+        assert content == "# Summary\nBody text"
+        assert metadata["duration"] == 3600
+        assert metadata["tags"] == ["ai"]
+        assert metadata["year"] == "2024"
+        assert metadata["flag"] == "true"
+        assert metadata["markdown_file"] == "episode_001.md"
+
+    def test_load_without_metadata(self, storage):
+        """Test documents starting with a rule are returned untouched"""
+        document = "---\nhello\n---\nbody"
+        path = storage.save_markdown(document, "plain", "notes")
+
+        assert storage.load_markdown(path) == (document, None)
+
+    def test_merge_with_document_frontmatter(self, storage):
+        """Test metadata joins the document's frontmatter without overriding its keys"""
+        document = (
+            MarkdownBuilder()
+            .add_frontmatter({"title": "Weekly", "year": "2024"})
+            .add_heading("Report")
+            .build()
+        )
+        path = storage.save_markdown(document, "report", "report", metadata={"title": "Override"})
+
+        saved = open(path).read()
+        content, metadata = storage.load_markdown(path)
+
+        assert saved.startswith("---\ntitle: Weekly\nyear: 2024\nstorage_metadata: {")
+        assert saved.count("---\n") == 2
+        assert content == document
+        assert metadata["title"] == "Override"
+        assert "year" not in metadata
+
+    def test_leading_horizontal_rule(self, storage):
+        """Test a document opening with a rule gets its own metadata block"""
+        document = "---\n# Heading\nBody text\n---\nMore"
+        path = storage.save_markdown(document, "rule", "notes", metadata={"k": 1})
+
+        saved = open(path).read()
+        content, metadata = storage.load_markdown(path)
+
+        assert saved.startswith("---\nstorage_metadata: {")
+        assert saved.endswith("---\n\n" + document)
+        assert content == document
+        assert metadata["k"] == 1
+
+    def test_multi_line_frontmatter_values(self, storage):
+        """Test nested YAML values in the document's frontmatter are left intact"""
+        document = "---\ntags:\n  - a\n  - b\nauthor: x\n---\n# Doc\n"
+        path = storage.save_markdown(document, "tags", "notes", metadata={"tags": ["z"]})
+
+        saved = open(path).read()
+        content, metadata = storage.load_markdown(path)
+
+        assert saved.startswith("---\ntags:\n  - a\n  - b\nauthor: x\nstorage_metadata: {")
+        assert content == document
+        assert metadata["tags"] == ["z"]
+
+    def test_load_legacy_json_sidecar(self, storage, tmp_path):
+        """Test metadata falls back to a .json sidecar"""
+        path = tmp_path / "legacy.md"
+        path.write_text("# Old")
+        (tmp_path / "legacy.json").write_text('{"source": "v1"}')
+
+        assert storage.load_markdown(str(path)) == ("# Old", {"source": "v1"})
+
+    def test_atomic_overwrite(self, storage):
+        """Test saves replace the file and leave no temp files behind"""
+        storage.save_markdown("first", "doc", "summary")
+        path = storage.save_markdown("second", "doc", "summary")
+
+        assert open(path).read() == "second"
+        assert not [name for name in os.listdir(os.path.dirname(path)) if name.startswith(".tmp_")]
+
+    def test_recreates_removed_directory(self, storage, tmp_path):
+        """Test saves recover when a cached directory is deleted"""
+        storage.save_markdown("first", "a", "summary")
+        shutil.rmtree(tmp_path / "summary")
+
+        path = storage.save_markdown("second", "b", "summary")
+
+        assert open(path).read() == "second"
+
+    def test_get_latest(self, storage, tmp_path):
+        """Test the latest file comes from the index, or a walk without it"""
+        storage.save_markdown("old", "a", "summary", timestamp=datetime(2024, 1, 1))
+        latest = storage.save_markdown("new", "b", "summary", timestamp=datetime(2024, 1, 2))
+
+        assert storage.get_latest("summary") == latest
+
+        os.remove(tmp_path / "summary" / FileStorage.INDEX_FILENAME)
+        assert storage.get_latest("summary") == latest
+        assert storage.get_latest("missing") is None
+
+    def test_list_files_across_instances(self, storage, tmp_path):
+        """Test listings see files another instance adds to an existing directory"""
+        other = FileStorage(StorageConfig(base_dir=str(tmp_path)))
+
+        other.save_markdown("one", "f1", "summary")
+        assert len(storage.list_files()) == 1
+
+        other.save_markdown("two", "f2", "summary")
+        assert len(storage.list_files()) == 2
+        assert len(storage.list_files("summary")) == 2
+        assert storage.list_files("missing") == []
+
+    def test_append_markdown(self, storage):
+        """Test appends accumulate and descriptors stay bounded"""
+        storage.MAX_APPEND_FDS = 2
+        for i in range(3):
+            for name in ("a", "b", "c"):
+                path = storage.append_markdown(f"{name}{i}\n", name, "stream")
+
+        assert len(storage._append_fds) == 2
+        assert open(path).read() == "c0\nc1\nc2\n"
+
+        storage.close()
+        assert len(storage._append_fds) == 0
+        storage.append_markdown("c3\n", "c", "stream")
+        assert open(path).read().endswith("c3\n")
+
+    @pytest.mark.asyncio
+    async def test_save_markdown_async(self, storage):
+        """Test batched async saves and a clean shutdown of the writer"""
+        paths = await asyncio.gather(*[
+            storage.save_markdown_async(f"doc {i}", f"doc_{i}", "summary", metadata={"i": i})
+            for i in range(20)
+        ])
+
+        await storage.aclose()
+
+        assert storage._writer_task is None
+        assert len(storage.list_files("summary")) == 20
+        content, metadata = storage.load_markdown(paths[7])
+        assert (content, metadata["i"]) == ("doc 7", 7)
+
+
+class TestMarkdownBuilder:
+    """Test suite for Markdown Builder"""
+
+    def test_build(self):
+        """Test sections are joined in order with frontmatter first"""
+        document = (
+            MarkdownBuilder()
+            .add_heading("Title")
+            .add_list(["a", "b"])
+            .add_table(["k", "v"], [["x", "1"]])
+            .add_frontmatter({"title": "T", "count": 2})
+            .build()
+        )
+
+        assert document == (
+            "---\ntitle: T\ncount: 2\n---\n\n"
+            "# Title\n\n"
+            "- a\n- b\n\n"
+            "| k | v |\n| --- | --- |\n| x | 1 |\n"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,158 @@
+"""
+Unit tests for Metrics Collection
+"""
+
+import pytest
+import numpy as np
+from monitoring.metrics import MetricsCollector, QuantileSketch, PerformanceMonitor
+
+
+@pytest.fixture
+def collector():
+    """Fresh metrics collector"""
+    return MetricsCollector()
+
+
+class TestQuantileSketch:
+    """Test suite for the DDSketch quantile estimator"""
+
+    @pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+    def test_quantile_accuracy(self, quantile):
+        """Test estimates stay within the relative accuracy of the exact value"""
+        values = np.random.default_rng(42).lognormal(mean=4.0, sigma=1.0, size=10_000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(float(value))
+
+        # The sketch reports the sample at rank int(q * n)
+        exact = np.sort(values)[int(quantile * len(values))]
+
+        assert sketch.get_quantile_value(quantile) == pytest.approx(exact, rel=0.01)
+
+    def test_negative_and_zero_values(self):
+        """Test quantiles over negative, zero and positive samples"""
+        sketch = QuantileSketch()
+        for value in [-10.0, -1.0, 0.0, 0.0, 1.0, 10.0]:
+            sketch.add(value)
+
+        low, mid, high = sketch.get_quantile_values([0.0, 0.5, 0.99])
+
+        assert low == pytest.approx(-10.0, rel=0.01)
+        assert mid == 0.0
+        assert high == pytest.approx(10.0, rel=0.01)
+        assert (sketch.count, sketch.min, sketch.max) == (6, -10.0, 10.0)
+
+    def test_empty_sketch(self):
+        """Test an empty sketch reports zeros"""
+        assert QuantileSketch().get_quantile_values([0.5, 0.99]) == [0.0, 0.0]
+
+
+class TestMetricsCollector:
+    """Test suite for Metrics Collector"""
+
+    def test_bound_metric_increments(self, collector):
+        """Test bound handles share keys with the labelled API"""
+        labels = {"b": "2", "a": "1"}
+        counter = collector.bind("requests", labels)
+
+        counter.inc()
+        counter.inc(2)
+        counter.dec()
+        collector.increment("requests", labels={"a": "1", "b": "2"})
+
+        assert counter.key == "requests{a=1,b=2}"
+        assert collector.get_counter("requests", labels) == 3
+
+        gauge = collector.bind("queue_depth")
+        gauge.set(7)
+        assert collector.get_gauge("queue_depth") == 7
+
+        latency = collector.bind("latency_ms", labels)
+        for value in (10, 20, 30):
+            latency.observe(value)
+        stats = collector.get_histogram_stats("latency_ms", labels)
+        assert stats["count"] == 3
+        assert stats["mean"] == pytest.approx(20)
+
+    def test_reset(self, collector):
+        """Test reset clears metrics and restores the standard counters"""
+        collector.increment("tasks_submitted", 5)
+        collector.increment("custom")
+        collector.set_gauge("queue_depth", 3)
+        collector.record("task_execution_time_ms", 100)
+        collector.get_all_metrics()
+
+        collector.reset()
+        metrics = collector.get_all_metrics()
+
+        assert metrics["counters"]["tasks_submitted"] == 0
+        assert "custom" not in metrics["counters"]
+        assert metrics["gauges"] == {}
+        assert metrics["histograms"] == {}
+
+    def test_snapshot_staleness(self, collector):
+        """Test readers share a snapshot until it expires"""
+        collector.SNAPSHOT_MAX_AGE_SECONDS = 60
+        collector.increment("tasks_submitted")
+        assert collector.get_all_metrics()["counters"]["tasks_submitted"] == 1
+
+        # Within the window the memoized snapshot is served
+        collector.increment("tasks_submitted")
+        assert collector.get_all_metrics()["counters"]["tasks_submitted"] == 1
+        assert collector.get_counter("tasks_submitted") == 2
+
+        # Once expired, the next read takes a fresh snapshot
+        collector.SNAPSHOT_MAX_AGE_SECONDS = 0
+        assert collector.get_all_metrics()["counters"]["tasks_submitted"] == 2
+
+    def test_snapshot_copies_are_independent(self, collector):
+        """Test callers cannot mutate the shared snapshot"""
+        collector.SNAPSHOT_MAX_AGE_SECONDS = 60
+        collector.get_all_metrics()["counters"]["tasks_submitted"] = 99
+
+        assert collector.get_all_metrics()["counters"]["tasks_submitted"] == 0
+
+    def test_export_prometheus_format(self, collector):
+        """Test Prometheus text export"""
+        collector.increment("tasks_completed", 2)
+        collector.set_gauge("queue_depth", 4)
+        for value in (100, 200, 300):
+            collector.record("task_execution_time_ms", value)
+
+        text = collector.export_prometheus_format()
+        lines = text.splitlines()
+
+        assert "# TYPE tasks_completed counter" in lines
+        assert "tasks_completed 2" in lines
+        assert "# TYPE queue_depth gauge" in lines
+        assert "queue_depth 4" in lines
+        assert "# TYPE task_execution_time_ms summary" in lines
+        assert "task_execution_time_ms_count 3" in lines
+        p50 = next(line for line in lines if line.startswith('task_execution_time_ms{quantile="0.5"}'))
+        assert float(p50.split()[-1]) == pytest.approx(200, rel=0.01)
+
+    def test_sla_compliance(self, collector):
+        """Test SLA checks from task counters and latency"""
+        collector.increment("tasks_completed", 100)
+        collector.record("task_execution_time_ms", 120)
+
+        sla = collector.check_sla_compliance()
+
+        assert sla == {
+            "latency_p95_under_500ms": True,
+            "error_rate_under_1_percent": True,
+            "success_rate_above_99_percent": True
+        }
+
+    def test_performance_monitor(self, collector):
+        """Test the timing context manager records a duration"""
+        with PerformanceMonitor(collector, "block_ms"):
+            sum(range(1000))
+
+        stats = collector.get_histogram_stats("block_ms")
+        assert stats["count"] == 1
+        assert stats["max"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
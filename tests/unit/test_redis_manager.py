@@ -4,20 +4,28 @@ Unit tests for Redis State Manager
 
 import pytest
 import time
+import orjson
 from unittest.mock import Mock, patch, MagicMock
 from state.redis_manager import RedisStateManager, TaskState, TaskStatus, AgentInfo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_redis():
-    """Mock Redis client"""
+    """Mock Redis client, patched once for the whole module"""
     with patch('state.redis_manager.redis.Redis') as mock:
         redis_client = MagicMock()
         mock.return_value = redis_client
-        redis_client.ping.return_value = True
         yield redis_client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_redis(mock_redis):
+    """Give each test a clean mock without re-patching"""
+    mock_redis.ping.return_value = True
+    yield
+    mock_redis.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def state_manager(mock_redis):
     """Create state manager with mocked Redis"""
@@ -55,43 +63,64 @@ class TestRedisStateManager:
         """Test task retrieval"""
         task_data = {
             "task_id": "test-123",
-            "status": "queued",
             "task_type": "test",
             "created_at": time.time(),
-            "updated_at": time.time(),
-            "agent_executions": [],
             "metadata": {},
-            "retry_count": 0,
             "priority": 5
         }
+        state_data = {
+            "status": "queued",
+            "updated_at": repr(time.time()),
+            "retry_count": "0"
+        }
 
-        import json
-        mock_redis.get.return_value = json.dumps(task_data)
+        mock_redis.pipeline.return_value.execute.return_value = [
+            orjson.dumps(task_data).decode(), state_data, [orjson.dumps({"agent": "a"}).decode()]
+        ]
 
         task = state_manager.get_task("test-123")
 
         assert task is not None
         assert task.task_id == "test-123"
         assert task.status == TaskStatus.QUEUED
-
-    def test_update_task_status(self, state_manager, mock_redis):
-        """Test task status update"""
-        task_data = {
-            "task_id": "test-123",
-            "status": "queued",
+        assert task.agent_executions == [{"agent": "a"}]
+        assert task.output is None
+
+    def test_get_legacy_task(self, state_manager, mock_redis):
+        """Test a task stored as a single blob is read and migrated"""
+        legacy_data = {
+            "task_id": "old-1",
+            "status": "running",
             "task_type": "test",
             "created_at": time.time(),
             "updated_at": time.time(),
-            "agent_executions": [],
+            "agent_executions": [{"agent": "a"}],
             "metadata": {},
-            "retry_count": 0,
+            "output": None,
+            "error": None,
+            "retry_count": 1,
             "priority": 5
         }
+        mock_redis.pipeline.return_value.execute.return_value = [
+            orjson.dumps(legacy_data).decode(), {}, []
+        ]
+        script = mock_redis.register_script.return_value
 
-        import json
-        mock_redis.get.return_value = json.dumps(task_data)
-        mock_redis.set.return_value = True
-        mock_redis.publish.return_value = 1
+        task = state_manager.get_task("old-1")
+
+        assert task is not None
+        assert task.status == TaskStatus.RUNNING
+        assert task.agent_executions == [{"agent": "a"}]
+        assert task.retry_count == 1
+        script.assert_called_once()
+        assert script.call_args.kwargs["keys"] == [
+            "task:old-1", "task_state:old-1", "task_executions:old-1"
+        ]
+
+    def test_update_task_status(self, state_manager, mock_redis):
+        """Test task status update"""
+        script = mock_redis.register_script.return_value
+        script.return_value = 1
 
         result = state_manager.update_task_status(
             "test-123",
@@ -99,8 +128,21 @@ class TestRedisStateManager:
         )
 
         assert result is True
-        mock_redis.set.assert_called_once()
-        mock_redis.publish.assert_called_once()
+        script.assert_called_once()
+        assert script.call_args.kwargs["keys"] == ["task_state:test-123"]
+        args = script.call_args.kwargs["args"]
+        assert args[0] == "running"
+        assert args[4] == "task_updates:test-123"
+        mock_redis.get.assert_not_called()
+        mock_redis.set.assert_not_called()
+
+    def test_update_missing_task_status(self, state_manager, mock_redis):
+        """Test status update for an unknown task"""
+        mock_redis.register_script.return_value.return_value = 0
+
+        result = state_manager.update_task_status("missing", TaskStatus.RUNNING)
+
+        assert result is False
 
     def test_register_agent(self, state_manager, mock_redis):
         """Test agent registration"""
@@ -116,14 +158,21 @@ class TestRedisStateManager:
             metadata={}
         )
 
-        mock_redis.set.return_value = True
-        mock_redis.sadd.return_value = 1
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [0, 9, 1, 1]
 
         result = state_manager.register_agent(agent_info)
 
         assert result is True
-        mock_redis.set.assert_called_once()
-        mock_redis.sadd.assert_called_once()
+        mock_redis.pipeline.assert_called_once()
+        # A legacy string record is dropped before the hash is written
+        assert [c[0] for c in pipe.mock_calls[:2]] == ["delete", "hset"]
+        pipe.delete.assert_called_once_with("agent:agent-1")
+        pipe.hset.assert_called_once()
+        pipe.sadd.assert_called_once_with("agent_type_idx:test_agent", "agent-1")
+        pipe.execute.assert_called_once()
+        mock_redis.hset.assert_not_called()
+        mock_redis.sadd.assert_not_called()
 
     def test_get_agents_by_type(self, state_manager, mock_redis):
         """Test retrieving agents by type"""
@@ -131,22 +180,143 @@ class TestRedisStateManager:
             "agent_id": "agent-1",
             "agent_type": "test_agent",
             "endpoint": "localhost:50052",
-            "capabilities": ["test"],
-            "max_concurrent_tasks": 10,
-            "current_tasks": 0,
-            "healthy": True,
-            "last_heartbeat": time.time(),
-            "metadata": {}
+            "capabilities": '["test"]',
+            "max_concurrent_tasks": "10",
+            "current_tasks": "0",
+            "healthy": "1",
+            "last_heartbeat": str(time.time()),
+            "metadata": "{}"
         }
 
-        import json
         mock_redis.smembers.return_value = {"agent-1"}
-        mock_redis.get.return_value = json.dumps(agent_data)
+        mock_redis.pipeline.return_value.execute.return_value = [agent_data]
 
         agents = state_manager.get_agents_by_type("test_agent")
 
         assert len(agents) == 1
         assert agents[0].agent_id == "agent-1"
+        assert agents[0].capabilities == ["test"]
+        assert agents[0].healthy is True
+        mock_redis.pipeline.return_value.hgetall.assert_called_once_with("agent:agent-1")
+        mock_redis.get.assert_not_called()
+
+    def test_get_agent_cached(self, state_manager, mock_redis):
+        """Test repeated agent lookups are served from the local cache"""
+        mock_redis.hgetall.return_value = {
+            "agent_id": "agent-1",
+            "agent_type": "test_agent",
+            "endpoint": "localhost:50052",
+            "capabilities": '["test"]',
+            "max_concurrent_tasks": "10",
+            "current_tasks": "0",
+            "healthy": "1",
+            "last_heartbeat": str(time.time()),
+            "metadata": "{}"
+        }
+
+        first = state_manager.get_agent("agent-1")
+        second = state_manager.get_agent("agent-1")
+
+        assert first == second
+        mock_redis.hgetall.assert_called_once_with("agent:agent-1")
+
+        # An invalidation message evicts the entry
+        state_manager._on_agent_update({"data": "agent-1"})
+        state_manager.get_agent("agent-1")
+        assert mock_redis.hgetall.call_count == 2
+
+    def test_update_agent_heartbeat(self, state_manager, mock_redis):
+        """Test heartbeat updates a single hash field"""
+        script = mock_redis.register_script.return_value
+        script.return_value = 1
+
+        result = state_manager.update_agent_heartbeat("agent-1")
+
+        assert result is True
+        script.assert_called_once()
+        assert script.call_args.kwargs["keys"] == ["agent:agent-1"]
+        assert script.call_args.kwargs["args"][0] == "last_heartbeat"
+        mock_redis.get.assert_not_called()
+        mock_redis.set.assert_not_called()
+        mock_redis.hset.assert_not_called()
+
+    def test_update_heartbeat_unknown_agent(self, state_manager, mock_redis):
+        """Test heartbeat for an unregistered agent is rejected"""
+        mock_redis.register_script.return_value.return_value = 0
+
+        result = state_manager.update_agent_heartbeat("missing")
+
+        assert result is False
+        mock_redis.delete.assert_not_called()
+
+    def test_set_agent_health(self, state_manager, mock_redis):
+        """Test health changes write one field and announce the change"""
+        script = mock_redis.register_script.return_value
+        script.return_value = 1
+
+        assert state_manager.set_agent_health("agent-1", False) is True
+        script.assert_called_once_with(
+            keys=["agent:agent-1"], args=["healthy", 0, "agent_updates", "agent-1"]
+        )
+        mock_redis.hset.assert_not_called()
+
+        script.return_value = 0
+        assert state_manager.set_agent_health("missing", True) is False
+
+    def test_increment_agent_tasks(self, state_manager, mock_redis):
+        """Test task count is adjusted server-side in one call"""
+        script = mock_redis.register_script.return_value
+        script.return_value = 3
+
+        assert state_manager.increment_agent_tasks("agent-1", 1) is True
+        script.assert_called_once_with(keys=["agent:agent-1"], args=[1])
+        mock_redis.get.assert_not_called()
+
+        script.return_value = -1
+        assert state_manager.increment_agent_tasks("missing", 1) is False
+
+    def test_cleanup_stale_agents(self, state_manager, mock_redis):
+        """Test stale agents are found with a filtered scan and removed in batch"""
+        now = time.time()
+        pipe = mock_redis.pipeline.return_value
+        state_manager._legacy_agent_keys_removed = True
+        mock_redis.scan_iter.return_value = iter(["agent:old", "agent:new"])
+        pipe.execute.return_value = [
+            ["old", "test_agent", str(now - 120)],
+            ["new", "test_agent", str(now)]
+        ]
+
+        state_manager.cleanup_stale_agents(max_age_seconds=60)
+
+        mock_redis.scan_iter.assert_called_once_with(match="agent:*", count=500, _type="hash")
+        pipe.delete.assert_called_once_with("agent:old")
+        pipe.srem.assert_called_once_with("agent_type_idx:test_agent", "old")
+
+    def test_cleanup_legacy_agent_keys(self, state_manager, mock_redis):
+        """Test agents stored as JSON strings are deleted on the first cleanup only"""
+        keys = {"string": ["agent:legacy"], "set": [], "hash": []}
+        mock_redis.scan_iter.side_effect = lambda match, count, _type: iter(keys[_type])
+        mock_redis.delete.return_value = 1
+
+        state_manager.cleanup_stale_agents()
+        state_manager.cleanup_stale_agents()
+
+        mock_redis.delete.assert_called_once_with("agent:legacy")
+        string_scans = [
+            c for c in mock_redis.scan_iter.call_args_list if c.kwargs["_type"] == "string"
+        ]
+        assert len(string_scans) == 1
+
+    def test_cleanup_legacy_type_indexes(self, state_manager, mock_redis):
+        """Test old agent:type:* index sets are deleted on the first cleanup"""
+        keys = {"string": [], "set": ["agent:type:test_agent"], "hash": []}
+        mock_redis.scan_iter.side_effect = lambda match, count, _type: iter(keys[_type])
+        mock_redis.delete.return_value = 1
+
+        state_manager.cleanup_stale_agents()
+
+        mock_redis.scan_iter.assert_any_call(match="agent:type:*", count=500, _type="set")
+        mock_redis.delete.assert_called_once_with("agent:type:test_agent")
 
     def test_acquire_lock(self, state_manager, mock_redis):
         """Test distributed lock acquisition"""
@@ -0,0 +1,364 @@
+"""
+Unit tests for the Stress Test Runner
+"""
+
+import asyncio
+import os
+import statistics
+import pytest
+from collections import deque
+from tests.stress import run_stress_test
+from tests.stress.run_stress_test import (
+    StressTestRunner, _RunningStat, _TrendStat, _ScenarioMetric, _weighted_median
+)
+
+
+STATS_CSV = """Type,Name,Request Count,Failure Count,Median Response Time,Average Response Time,Min Response Time,Max Response Time,Average Content Size,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,99%,99.9%,99.99%,100%
+POST,/api/tasks,1500,15,45,60.5,3,900,120,25.0,0.25,45,50,55,60,80,140,200,310,600,900,900
+,Aggregated,2000,20,42,58.25,3,900,118,33.3,0.33,42,48,52,58,75,130,190,300,600,900,900
+"""
+
+STATS_HISTORY_CSV = """Timestamp,User Count,Type,Name,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,99%,99.9%,99.99%,100%
+1700000000,10,,Aggregated,5,0,40,45,50,55,70,100,150,200,300,300,300
+1700000000,10,POST,/api/tasks,5,0,40,45,50,55,70,999,150,200,300,300,300
+1700000010,20,,Aggregated,10,0,40,45,50,55,70,120,150,200,300,300,300
+1700000020,30,,Aggregated,15,0,40,45,50,55,70,N/A,150,200,300,300,300
+1700000030,40,,Aggregated,20,0,40,45,50,55,70,160,150,200,300,300,300
+"""
+
+STDOUT_SUMMARY = """
+Total Requests: 1200
+Failed Requests: 3
+Error Rate: 0.25%
+Median Response Time: 40ms
+95th Percentile: 120ms
+99th Percentile: 300ms
+Average Response Time: 55.5ms
+RPS: 20.5
+"""
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    """Point the runner at a temporary results directory"""
+    monkeypatch.setattr(run_stress_test, "RESULTS_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestStatistics:
+    """Test suite for the streaming statistics helpers"""
+
+    def test_weighted_median(self):
+        """Test the median follows the request-count weights"""
+        assert _weighted_median([(100, 1), (900, 10), (200, 1)]) == 900
+        assert _weighted_median([(300, 0), (100, 0), (200, 0)]) == 200
+        assert _weighted_median([]) == 0.0
+
+    def test_running_stat(self):
+        """Test Welford's mean and sample stddev match the statistics module"""
+        values = [120.0, 95.5, 410.0, 230.25, 88.0]
+        stat = _RunningStat()
+        for value in values:
+            stat.update(value)
+
+        assert stat.mean == pytest.approx(statistics.mean(values))
+        assert stat.stddev == pytest.approx(statistics.stdev(values))
+        assert stat.sum_squares == pytest.approx(sum(v * v for v in values))
+
+    def test_running_stat_single_sample(self):
+        """Test stddev is zero with a single sample"""
+        stat = _RunningStat()
+        stat.update(5)
+
+        assert (stat.mean, stat.stddev) == (5, 0.0)
+
+    def test_trend_stat(self):
+        """Test the slope and EWMA of a linear series"""
+        trend = _TrendStat(alpha=0.5)
+        for t, y in [(0, 100), (10, 120), (20, 140)]:
+            trend.update(t, y)
+
+        assert trend.slope == pytest.approx(2.0)
+        assert trend.ewma == pytest.approx(125.0)
+
+    def test_trend_stat_degenerate(self):
+        """Test the slope is zero without two distinct timestamps"""
+        trend = _TrendStat()
+        assert trend.slope == 0.0
+
+        trend.update(5, 100)
+        trend.update(5, 200)
+        assert trend.slope == 0.0
+
+    def test_scenario_metric_skips_missing_metrics(self):
+        """Test timed-out scenarios count as failures without zero samples"""
+        agg = _ScenarioMetric()
+        agg.update({"success": True, "metrics": {
+            "total_requests": 100, "failed_requests": 1,
+            "error_rate_percent": 1.0, "p95_ms": 200
+        }})
+        agg.update({"success": True, "metrics": {
+            "total_requests": 300, "failed_requests": 0,
+            "error_rate_percent": 0.0, "p95_ms": 400
+        }})
+        agg.update({"success": False, "error": "Timeout"})
+
+        result = agg.compute()
+
+        assert result["scenarios_total"] == 3
+        assert result["scenarios_passed"] == 2
+        assert result["total_requests"] == 400
+        assert result["average_p95_latency_ms"] == 300
+        assert result["median_p95_latency_ms"] == 400
+        assert result["average_error_rate_percent"] == 0.5
+
+
+class TestParseOutput:
+    """Test suite for scenario output parsing"""
+
+    def test_parse_csv(self, results_dir):
+        """Test metrics come from the Aggregated rows of Locust's CSVs"""
+        (results_dir / "load_stats.csv").write_text(STATS_CSV)
+        (results_dir / "load_stats_history.csv").write_text(STATS_HISTORY_CSV)
+        scenario_result = {"name": "load"}
+
+        StressTestRunner()._parse_output(scenario_result, STDOUT_SUMMARY)
+
+        metrics = scenario_result["metrics"]
+        assert metrics["total_requests"] == 2000
+        assert metrics["failed_requests"] == 20
+        assert metrics["error_rate_percent"] == pytest.approx(1.0)
+        assert metrics["p95_ms"] == 130
+        assert metrics["p99_ms"] == 300
+        assert metrics["avg_ms"] == 58.25
+        assert metrics["rps"] == 33.3
+        assert metrics["latency_slope_ms_per_s"] == pytest.approx(2.0)
+        assert scenario_result["degrading"] is True
+
+    def test_parse_stdout_fallback(self, results_dir):
+        """Test the printed summary is used when no CSV was written"""
+        scenario_result = {"name": "load"}
+
+        StressTestRunner()._parse_output(scenario_result, STDOUT_SUMMARY)
+
+        metrics = scenario_result["metrics"]
+        assert metrics["total_requests"] == 1200
+        assert metrics["failed_requests"] == 3
+        assert metrics["error_rate_percent"] == 0.25
+        assert metrics["p95_ms"] == 120
+        assert metrics["rps"] == 20.5
+        assert "degrading" not in scenario_result
+
+
+class FakeStreamReader:
+    """asyncio.StreamReader stand-in that returns preset chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.read_sizes = []
+
+    async def read(self, n=-1):
+        self.read_sizes.append(n)
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class FakeProcess:
+    """Locust subprocess stand-in; hangs until killed if hang=True"""
+
+    def __init__(self, stdout=b"", stderr=b"", returncode=0, hang=False):
+        self.stdout = FakeStreamReader([stdout] if stdout else [])
+        self.stderr = FakeStreamReader([stderr] if stderr else [])
+        self.returncode = None
+        self._exit_code = returncode
+        self._exited = asyncio.Event()
+        self.killed = False
+        if not hang:
+            self._exited.set()
+
+    async def wait(self):
+        await self._exited.wait()
+        if self.returncode is None:
+            self.returncode = self._exit_code
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+        self._exited.set()
+
+
+@pytest.fixture
+def spawned(results_dir, monkeypatch):
+    """Stub Locust launches; tests queue FakeProcesses and read back the commands"""
+    spawned = {"commands": [], "processes": []}
+
+    async def create_subprocess_exec(*cmd, stdout=None, stderr=None):
+        spawned["commands"].append(cmd)
+        return spawned["processes"].pop(0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    return spawned
+
+
+class TestReadStream:
+    """Test suite for draining Locust's output pipes"""
+
+    @pytest.mark.asyncio
+    async def test_read_stream_keeps_tail(self):
+        """Test chunked output larger than the tail keeps only its last lines"""
+        data = b"".join(b"line %06d\n" % i for i in range(20_000)) + b"partial"
+        chunk = run_stress_test.READ_CHUNK_BYTES
+        # 12-byte lines never align with the chunk size, so lines straddle chunks
+        reader = FakeStreamReader(data[i:i + chunk] for i in range(0, len(data), chunk))
+        tail = deque(maxlen=5)
+
+        await StressTestRunner._read_stream(reader, tail)
+
+        assert len(data) > 3 * chunk
+        assert set(reader.read_sizes) == {chunk}
+        assert list(tail) == [
+            b"line 019996\n", b"line 019997\n", b"line 019998\n", b"line 019999\n", b"partial"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_stream_split_lines(self):
+        """Test lines split across small chunks are reassembled"""
+        reader = FakeStreamReader([b"Total Req", b"uests: 12", b"\nRPS", b": 2.5\n"])
+        tail = deque(maxlen=10)
+
+        await StressTestRunner._read_stream(reader, tail)
+
+        assert list(tail) == [b"Total Requests: 12\n", b"RPS: 2.5\n"]
+
+
+class TestRunScenario:
+    """Test suite for launching Locust scenarios"""
+
+    @pytest.mark.asyncio
+    async def test_run_scenario(self, spawned, results_dir):
+        """Test a finished run keeps the output tail and parses its summary"""
+        noise = b"".join(b"noise %d\n" % i for i in range(run_stress_test.OUTPUT_TAIL_LINES))
+        spawned["processes"].append(FakeProcess(
+            stdout=noise + STDOUT_SUMMARY.encode(), stderr=b"warning\n"
+        ))
+        (results_dir / "load_failures.csv").write_text("stale")
+        runner = StressTestRunner()
+
+        result = await runner.run_test_scenario("load", 10, 2, 1, host="http://sut:8000")
+
+        cmd = spawned["commands"][0]
+        assert cmd[cmd.index("--host") + 1] == "http://sut:8000"
+        assert cmd[cmd.index("--csv") + 1] == os.path.join(str(results_dir), "load")
+        assert not (results_dir / "load_failures.csv").exists()
+        assert result["success"] is True
+        assert result["errors"] == "warning\n"
+        assert len(result["output"].splitlines()) == run_stress_test.OUTPUT_TAIL_LINES
+        assert result["output"].endswith("RPS: 20.5\n")
+        assert "noise 0\n" not in result["output"]
+        assert result["metrics"]["total_requests"] == 1200
+        assert runner.results["test_scenarios"] == [result]
+
+    @pytest.mark.asyncio
+    async def test_run_scenario_timeout(self, spawned, monkeypatch):
+        """Test a hung Locust process is killed and recorded as a failure"""
+        monkeypatch.setattr(run_stress_test, "SCENARIO_TIMEOUT_GRACE_SECONDS", 0.05)
+        process = FakeProcess(hang=True)
+        spawned["processes"].append(process)
+        runner = StressTestRunner()
+
+        result = await runner.run_test_scenario("load", 10, 2, 0)
+
+        assert process.killed
+        assert result["success"] is False
+        assert result["error"] == "Timeout"
+        assert "metrics" not in result
+        assert runner._calculate_aggregate_metrics()["scenarios_total"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("hosts,expected_concurrency", [
+        (["http://a:8000", "http://b:8000"], 2),
+        ([None, None], 1),
+    ])
+    async def test_run_all_scenarios_parallel(self, results_dir, monkeypatch,
+                                              hosts, expected_concurrency):
+        """Test parallel runs need a distinct host per scenario"""
+        scenarios = [
+            {"name": f"s{i}", "users": 1, "spawn_rate": 1, "duration": 1}
+            for i in range(2)
+        ]
+        for scenario, host in zip(scenarios, hosts):
+            if host:
+                scenario["host"] = host
+        monkeypatch.setattr(run_stress_test, "SCENARIOS", scenarios)
+        monkeypatch.setattr(run_stress_test, "COOL_DOWN_SECONDS", 0)
+        monkeypatch.delenv("STRESS_HOST", raising=False)
+
+        running = {"now": 0, "max": 0}
+
+        class SlowProcess(FakeProcess):
+            async def wait(self):
+                await asyncio.sleep(0.01)
+                running["now"] -= 1
+                return await super().wait()
+
+        async def create_subprocess_exec(*cmd, stdout=None, stderr=None):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            return SlowProcess(stdout=STDOUT_SUMMARY.encode())
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+        runner = StressTestRunner()
+
+        await runner.run_all_scenarios(parallel=True)
+
+        assert running["max"] == expected_concurrency
+        assert len(runner.results["test_scenarios"]) == 2
+
+
+
+class TestFailFast:
+    """Test suite for the per-scenario SLA gate"""
+
+    @pytest.mark.parametrize("metrics,passes", [
+        ({"p95_ms": 499, "error_rate_percent": 0.99}, True),
+        ({"p95_ms": 500, "error_rate_percent": 0.0}, False),
+        ({"p95_ms": 100, "error_rate_percent": 1.0}, False),
+        ({}, False),
+        (None, False),
+    ])
+    def test_scenario_passes_sla(self, metrics, passes):
+        """Test the p95 latency and error rate thresholds"""
+        scenario_result = {"name": "load"}
+        if metrics is not None:
+            scenario_result["metrics"] = metrics
+
+        assert StressTestRunner._scenario_passes_sla(scenario_result) is passes
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fail_fast,expected", [
+        (True, ["s0", "s1"]),
+        (False, ["s0", "s1", "s2"]),
+    ])
+    async def test_fail_fast(self, results_dir, monkeypatch, fail_fast, expected):
+        """Test a sequential run stops at the first SLA breach only with fail_fast"""
+        monkeypatch.setattr(run_stress_test, "SCENARIOS", [
+            {"name": f"s{i}", "users": 1, "spawn_rate": 1, "duration": 1} for i in range(3)
+        ])
+        monkeypatch.setattr(run_stress_test, "COOL_DOWN_SECONDS", 0)
+        p95 = {"s0": 100, "s1": 900, "s2": 100}
+        runner = StressTestRunner(fail_fast=fail_fast)
+        ran = []
+
+        async def run_test_scenario(name, users, spawn_rate, duration, host):
+            ran.append(name)
+            return {"name": name, "metrics": {"p95_ms": p95[name], "error_rate_percent": 0.0}}
+
+        monkeypatch.setattr(runner, "run_test_scenario", run_test_scenario)
+
+        await runner.run_all_scenarios()
+
+        assert ran == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])